@@ -1,17 +1,20 @@
 """
-Redis-backed caching layer with JSON serialization.
+Redis-backed caching layer with JSON serialization (orjson).
 Falls back to a simple in-process dict if Redis is unavailable.
 """
 
-import json
 import logging
 from typing import Any, Callable, Awaitable
 
+import orjson
 import redis.asyncio as aioredis
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# numpy scalars (yfinance quotes) and non-str keys serialize like they did with json
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
 
 class RedisCache:
     """
@@ -21,33 +24,62 @@ class RedisCache:
 
     def __init__(self, redis_client: aioredis.Redis):
         self._redis = redis_client
-        self._local_fallback: dict[str, str] = {}
+        self._local_fallback: dict[str, str | bytes] = {}
         self._use_fallback = False
 
     async def get(self, key: str) -> Any | None:
         try:
             raw = await self._redis.get(key)
             if raw:
-                return json.loads(raw)
+                return orjson.loads(raw)
             return None
         except Exception:
             raw = self._local_fallback.get(key)
-            return json.loads(raw) if raw else None
+            return orjson.loads(raw) if raw else None
 
-    async def set(self, key: str, value: Any, ttl: int) -> None:
+    async def mget(self, keys: list[str]) -> list[Any | None]:
+        """Batch get: one MGET round-trip. Returns values aligned with keys (None = miss)."""
+        if not keys:
+            return []
+        try:
+            raws = await self._redis.mget(keys)
+        except Exception:
+            raws = [self._local_fallback.get(key) for key in keys]
+        return [orjson.loads(raw) if raw else None for raw in raws]
+
+    @staticmethod
+    def _serialize(value: Any) -> str | bytes:
+        # Python-mode dumps keep raw floats: the JSON-mode rounding serializers
+        # (scores, greeks) apply at the API boundary, not to cached values.
         if isinstance(value, BaseModel):
-            serialized = value.model_dump_json()
-        elif isinstance(value, list) and value and isinstance(value[0], BaseModel):
-            serialized = json.dumps([v.model_dump() for v in value])
-        else:
-            serialized = json.dumps(value)
+            return orjson.dumps(value.model_dump(), option=_ORJSON_OPTS)
+        if isinstance(value, list) and value and isinstance(value[0], BaseModel):
+            return orjson.dumps([v.model_dump() for v in value], option=_ORJSON_OPTS)
+        return orjson.dumps(value, option=_ORJSON_OPTS)
 
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        serialized = self._serialize(value)
         try:
             await self._redis.setex(key, ttl, serialized)
         except Exception as e:
             logger.debug("Redis set failed (%s), using local fallback", e)
             self._local_fallback[key] = serialized
 
+    async def pipeline_set(self, items: list[tuple[str, Any, int]]) -> None:
+        """Batch set: one SETEX per (key, value, ttl) item, sent in a single pipeline round-trip."""
+        if not items:
+            return
+        serialized = [(key, self._serialize(value), ttl) for key, value, ttl in items]
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for key, raw, ttl in serialized:
+                pipe.setex(key, ttl, raw)
+            await pipe.execute()
+        except Exception as e:
+            logger.debug("Redis pipeline set failed (%s), using local fallback", e)
+            for key, raw, _ in serialized:
+                self._local_fallback[key] = raw
+
     async def get_or_set(
         self,
         key: str,
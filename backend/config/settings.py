@@ -35,6 +35,28 @@ class Settings(BaseSettings):
     FINBERT_MAX_LENGTH: int = 512
     FINBERT_BATCH_SIZE: int = 16
     FINBERT_DEVICE: str = "cpu"  # set to "cuda" if GPU available
+    # Weight precision applied at load: "fp32" (unmodified weights, default), or opt-in
+    # lossy "int8" (dynamic quantization of Linear layers, CPU only), "fp16" (CUDA only),
+    # "bf16". Non-fp32 modes shift sentiment probabilities slightly.
+    FINBERT_QUANTIZATION: str = "fp32"
+    # Opt-in bf16 autocast around the forward pass. Only worth enabling with native
+    # bf16 (AMX/AVX512-BF16 CPUs, GPU tensor cores) — slower elsewhere, and the
+    # forward pass is no longer fp32. Ignored when weights are int8 or fp16.
+    FINBERT_AUTOCAST: bool = False
+    # Intel Extension for PyTorch kernel fusion on CPU (needs intel_extension_for_pytorch;
+    # skipped for int8 weights)
+    FINBERT_USE_IPEX: bool = False
+    # torch.compile (TorchInductor) the forward pass; compile cost is paid by a
+    # warmup batch in load(), so startup is slower
+    FINBERT_COMPILE: bool = False
+    # Concurrent score requests arriving within this window share one forward pass
+    FINBERT_MICROBATCH_WINDOW_MS: float = 5.0
+    # Max distinct texts kept in the scored-result LRU (0 disables caching)
+    FINBERT_RESULT_CACHE_SIZE: int = 10_000
+    # Inference backend: "torch" (eager PyTorch) or "onnx" (ONNX Runtime with graph
+    # fusion; needs `pip install optimum[onnxruntime]`, falls back to torch if absent)
+    FINBERT_BACKEND: str = "torch"
+    FINBERT_ONNX_CACHE_DIR: str = "~/.cache/finbert"
 
     # ML
     ML_MODEL_PATH: str = "ml/artifacts/spread_ranker.joblib"
@@ -228,7 +228,7 @@ class SchwabClient:
 
     async def _run(self, fn, *args):
         """Run a synchronous schwab-py call in the thread pool with a semaphore."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         async with _SCHWAB_SEMAPHORE:
             return await asyncio.wait_for(
                 loop.run_in_executor(_executor, fn, *args),
@@ -12,12 +12,14 @@ from datetime import date, datetime, timedelta
 from functools import lru_cache
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
+from aiolimiter import AsyncLimiter
 
 from backend.models.options import OptionQuote, OptionType, OptionsChain
 from backend.models.sentiment import NewsArticle
-from backend.scanner.greeks_calculator import compute_greeks
+from backend.scanner.greeks_calculator import compute_greeks_batch
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +32,10 @@ RISK_FREE_RATE = 0.05  # approximate 3-month T-bill rate
 # consume a slot. 20 concurrent is the practical ceiling before Yahoo starts
 # rate-limiting aggressively; retries are 3s/6s so failures recover quickly.
 _YFINANCE_SEMAPHORE = asyncio.Semaphore(20)
+# The semaphore caps in-flight calls but not their rate: fast calls free slots
+# immediately and Yahoo still sees bursts (→ 429 + retry backoff). A token
+# bucket spaces call starts to a steady per-second budget.
+_YFINANCE_LIMITER = AsyncLimiter(max_rate=30, time_period=1.0)
 
 _RATE_LIMIT_PHRASES = ("too many requests", "rate limit", "429", "no data found")
 
@@ -57,11 +63,14 @@ async def _run_sync(fn, *args, max_retries: int = 3):
       or spread construction), so 587 symbols can all be "in flight" with only N
       actually hitting Yahoo Finance at a time.
     - asyncio.wait_for adds a hard 25s timeout per call to kill hung connections.
+    - Each attempt also takes one token from _YFINANCE_LIMITER (30 calls/s) before
+      the semaphore, so call starts are spread out rather than bursted.
     - Rate-limit sleep happens OUTSIDE the semaphore so the slot is free for others.
     """
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     for attempt in range(max_retries):
         try:
+            await _YFINANCE_LIMITER.acquire()
             async with _YFINANCE_SEMAPHORE:
                 return await asyncio.wait_for(
                     loop.run_in_executor(_executor, fn, *args),
@@ -165,7 +174,27 @@ class YFinanceClient:
         T: float,
     ) -> list[OptionQuote]:
         quotes = []
-        for _, row in df.iterrows():
+
+        def _numeric_col(name: str) -> np.ndarray:
+            if name not in df:
+                return np.zeros(len(df))
+            # Missing values stay NaN: a NaN IV yields NaN greeks, as per-row compute_greeks did
+            return pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=np.float64)
+
+        # Greeks via Black-Scholes for the whole chain at once (one spot + one T per expiry)
+        greeks = compute_greeks_batch(
+            S=spot_price,
+            K=_numeric_col("strike"),
+            T=T,
+            r=RISK_FREE_RATE,
+            sigma=_numeric_col("impliedVolatility"),
+            option_type=option_type.value,
+        )
+        delta, gamma, theta, vega, rho = (
+            greeks[k].tolist() for k in ("delta", "gamma", "theta", "vega", "rho")
+        )
+
+        for i, (_, row) in enumerate(df.iterrows()):
             try:
                 iv = float(row.get("impliedVolatility", 0) or 0)
                 strike = float(row.get("strike", 0) or 0)
@@ -179,16 +208,6 @@ class YFinanceClient:
                 oi = _safe_int(row.get("openInterest"))
                 last = float(row.get("lastPrice", mid) or mid)
 
-                # Compute greeks via Black-Scholes
-                greeks = compute_greeks(
-                    S=spot_price,
-                    K=strike,
-                    T=T,
-                    r=RISK_FREE_RATE,
-                    sigma=iv,
-                    option_type=option_type.value,
-                )
-
                 # Build contract symbol if not present
                 symbol = str(row.get("contractSymbol", f"{underlying}_opt"))
 
@@ -206,11 +225,11 @@ class YFinanceClient:
                         volume=volume,
                         open_interest=oi,
                         implied_volatility=iv,
-                        delta=greeks["delta"],
-                        gamma=greeks["gamma"],
-                        theta=greeks["theta"],
-                        vega=greeks["vega"],
-                        rho=greeks["rho"],
+                        delta=delta[i],
+                        gamma=gamma[i],
+                        theta=theta[i],
+                        vega=vega[i],
+                        rho=rho[i],
                     )
                 )
             except Exception as e:
@@ -144,7 +144,7 @@ async def lifespan(app: FastAPI):
     logger.info("Loading FinBERT model (ProsusAI/finbert)...")
     finbert_loader = FinBERTLoader(settings)
     try:
-        finbert_loader.load()
+        await finbert_loader.load_async()
         logger.info("FinBERT ready")
     except Exception as e:
         logger.error(
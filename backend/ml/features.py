@@ -39,6 +39,7 @@ FEATURE_NAMES = [
     "price_vs_52w_low_pct",
     "sector_relative_strength",
 ]
+N_FEATURES = len(FEATURE_NAMES)
 
 
 class FeatureEngineer:
@@ -58,6 +59,22 @@ class FeatureEngineer:
         iv_52w_high: float = 0.60,
         iv_52w_low: float = 0.15,
     ) -> FeatureVector:
+        values = self.build_row(
+            spread, fundamentals, sentiment, spot_price, hv_30d, iv_52w_high, iv_52w_low
+        )
+        return FeatureVector(**dict(zip(FEATURE_NAMES, values, strict=True)))
+
+    def build_row(
+        self,
+        spread: SpreadCandidate,
+        fundamentals: FundamentalData,
+        sentiment: TickerSentiment,
+        spot_price: float,
+        hv_30d: float = 0.30,
+        iv_52w_high: float = 0.60,
+        iv_52w_low: float = 0.15,
+    ) -> tuple[float, ...]:
+        """Same features as build(), as a plain tuple in FEATURE_NAMES order (one matrix row)."""
         long = spread.long_leg
         short = spread.short_leg
 
@@ -114,36 +131,36 @@ class FeatureEngineer:
         p52h = (spot_price - p52h_val) / p52h_val if p52h_val > 0 else _nan
         p52l = (spot_price - p52l_val) / p52l_val if p52l_val > 0 else _nan
 
-        return FeatureVector(
+        return (
             # Options
-            iv_rank=float(iv_rank),
-            iv_percentile=float(iv_percentile),
-            bid_ask_spread_pct=float(ba_pct_long),
-            delta=float(abs(long.delta)),
-            gamma=float(long.gamma),
-            theta_per_day=float(long.theta),
-            dte=float(spread.dte),
-            moneyness=float(moneyness),
+            float(iv_rank),
+            float(iv_percentile),
+            float(ba_pct_long),
+            float(abs(long.delta)),
+            float(long.gamma),
+            float(long.theta),
+            float(spread.dte),
+            float(moneyness),
             # Spread structure
-            spread_width_pct=float(spread_width_pct),
-            max_risk_reward_ratio=float(rr_ratio),
-            net_debit_pct_of_spread=float(net_debit_pct),
+            float(spread_width_pct),
+            float(rr_ratio),
+            float(net_debit_pct),
             # Volatility
-            iv_vs_hv_ratio=float(iv_vs_hv),
-            iv_skew=iv_skew_val,
+            float(iv_vs_hv),
+            iv_skew_val,
             # Fundamentals
-            pe_ratio=pe,
-            revenue_growth=rev_growth,
-            debt_to_equity=debt_eq,
-            gross_margin=gross_margin,
-            fundamental_score=fund_score,
+            pe,
+            rev_growth,
+            debt_eq,
+            gross_margin,
+            fund_score,
             # Sentiment
-            sentiment_score=float(sent_score),
-            sentiment_compound=float(sent_compound),
+            float(sent_score),
+            float(sent_compound),
             # Technical
-            price_vs_52w_high_pct=p52h,
-            price_vs_52w_low_pct=p52l,
-            sector_relative_strength=float("nan"),  # no data source — XGBoost treats as missing
+            p52h,
+            p52l,
+            _nan,  # sector_relative_strength: no data source — XGBoost treats as missing
         )
 
     def to_numpy(self, fv: FeatureVector):
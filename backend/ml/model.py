@@ -26,6 +26,11 @@ logger = logging.getLogger(__name__)
 
 _ml_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ml_inference")
 
+# Feature columns read back out of the matrix to build each MLPrediction
+_PREDICTION_COLUMNS = (
+    "iv_rank", "dte", "max_risk_reward_ratio", "fundamental_score", "sentiment_score",
+)
+
 
 class SpreadRanker:
     """
@@ -88,35 +93,60 @@ class SpreadRanker:
     def predict_from_features(
         self, feature_vectors: list[FeatureVector]
     ) -> list[MLPrediction]:
+        """Predict from pre-built FeatureVectors (stacked into a matrix for predict_matrix)."""
+        from backend.ml.features import FEATURE_NAMES, N_FEATURES
+        if not feature_vectors:
+            return []
+        X = np.array(
+            [[getattr(fv, name) for name in FEATURE_NAMES] for fv in feature_vectors],
+            dtype=float,
+        ).reshape(-1, N_FEATURES)
+        return self.predict_matrix(X)
+
+    def predict_matrix(self, X: np.ndarray) -> list[MLPrediction]:
         """
-        Predict from pre-built FeatureVectors (used by scanner pipeline).
-        This is the primary inference path.
+        Predict from an (n, N_FEATURES) float matrix in FEATURE_NAMES column order
+        (built by the scanner pipeline). This is the primary inference path.
         """
-        if self._is_placeholder or not feature_vectors:
-            return [self._placeholder_from_fv(fv) for fv in feature_vectors]
+        if not len(X):
+            return []
+        from backend.ml.features import FEATURE_NAMES
+        col = {name: X[:, FEATURE_NAMES.index(name)].tolist() for name in _PREDICTION_COLUMNS}
+        rows = list(zip(*(col[name] for name in _PREDICTION_COLUMNS), strict=True))
+
+        if self._is_placeholder:
+            return [self._placeholder_from_values(*row) for row in rows]
 
         try:
-            from backend.ml.features import FEATURE_NAMES
-            X = np.array(
-                [[getattr(fv, name) for name in FEATURE_NAMES] for fv in feature_vectors],
-                dtype=float,
-            )
-            scores = self.pipeline.predict(X)
+            scores = self._predict_scores(X)
             importances = self._get_importances()
             return [
                 MLPrediction(
-                    spread_quality_score=float(np.clip(scores[i], 0, 100)),
-                    expected_return_pct=self._estimate_return(feature_vectors[i], scores[i]),
-                    probability_of_profit=float(feature_vectors[i].iv_rank / 100),
-                    confidence=self._compute_confidence(scores[i]),
+                    spread_quality_score=float(np.clip(score, 0, 100)),
+                    expected_return_pct=self._estimate_return(dte, rr, score),
+                    probability_of_profit=float(iv_rank / 100),
+                    confidence=self._compute_confidence(score),
                     feature_importances=importances,
                     is_placeholder=False,
                 )
-                for i in range(len(feature_vectors))
+                for score, (iv_rank, dte, rr, _, _) in zip(scores.tolist(), rows, strict=True)
             ]
         except Exception as e:
             logger.error("Feature-based ML inference error: %s", e)
-            return [self._placeholder_from_fv(fv) for fv in feature_vectors]
+            return [self._placeholder_from_values(*row) for row in rows]
+
+    def _predict_scores(self, X: np.ndarray) -> np.ndarray:
+        """
+        Scaler transform + booster.inplace_predict on the whole matrix (no per-call
+        DMatrix). Falls back to pipeline.predict for any other pipeline layout.
+        """
+        steps = getattr(self.pipeline, "named_steps", {})
+        xgb = steps.get("xgb")
+        if xgb is None or not hasattr(xgb, "get_booster"):
+            return np.asarray(self.pipeline.predict(X))
+        scaler = steps.get("scaler")
+        X = np.ascontiguousarray(scaler.transform(X) if scaler is not None else X)
+        return np.asarray(xgb.get_booster().inplace_predict(X))
 
     def get_feature_importance(self) -> dict[str, float]:
         """Return feature importances dict for UI display."""
@@ -162,13 +192,15 @@ class SpreadRanker:
         )
 
     @staticmethod
-    def _placeholder_from_fv(fv: FeatureVector) -> MLPrediction:
-        base = 40.0 + fv.fundamental_score * 0.2 + fv.sentiment_score * 0.1
+    def _placeholder_from_values(
+        iv_rank: float, dte: float, rr: float, fundamental_score: float, sentiment_score: float
+    ) -> MLPrediction:
+        base = 40.0 + fundamental_score * 0.2 + sentiment_score * 0.1
         score = max(20.0, min(80.0, base + random.uniform(-5, 5)))
         return MLPrediction(
             spread_quality_score=round(score, 2),
-            expected_return_pct=round(fv.max_risk_reward_ratio * 30, 2),
-            probability_of_profit=max(0.3, min(0.75, fv.iv_rank / 100 * 0.5 + 0.3)),
+            expected_return_pct=round(rr * 30, 2),
+            probability_of_profit=max(0.3, min(0.75, iv_rank / 100 * 0.5 + 0.3)),
             confidence=0.3,
             feature_importances={},
             is_placeholder=True,
@@ -186,10 +218,9 @@ class SpreadRanker:
         )
 
     @staticmethod
-    def _estimate_return(fv: FeatureVector, score: float) -> float:
+    def _estimate_return(dte: float, rr: float, score: float) -> float:
         """Rough annualized return estimate based on score and DTE."""
-        dte = max(fv.dte, 1)
-        rr = fv.max_risk_reward_ratio
+        dte = max(dte, 1)
         pop = max(0.35, min(0.80, score / 100))
         expected = (pop * rr - (1 - pop)) * 100
         annualized = expected * (365 / dte)
@@ -1,7 +1,7 @@
 from datetime import date
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_serializer
 
 
 class FundamentalData(BaseModel):
@@ -28,3 +28,8 @@ class FundamentalData(BaseModel):
     next_earnings_date: Optional[date] = None
     days_to_earnings: Optional[int] = None       # computed from next_earnings_date
     fundamental_score: Optional[float] = None    # computed 0-100
+
+    # FundamentalsScorer keeps the raw float; round once at the JSON boundary
+    @field_serializer("fundamental_score", when_used="json")
+    def _round_score(self, v: Optional[float]) -> Optional[float]:
+        return None if v is None else round(v, 2)
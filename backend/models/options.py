@@ -2,7 +2,7 @@ from datetime import date
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 
 class OptionType(str, Enum):
@@ -39,6 +39,11 @@ class OptionQuote(BaseModel):
     vega: float   # per 1% IV change
     rho: float
 
+    # compute_greeks returns raw floats; round once at the JSON boundary
+    @field_serializer("delta", "gamma", "theta", "vega", "rho", when_used="json")
+    def _round_greek(self, v: float) -> float:
+        return round(v, 6)
+
 
 class OptionsChain(BaseModel):
     underlying: str
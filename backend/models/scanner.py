@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 from .fundamentals import FundamentalData
 from .ml import MLPrediction
@@ -59,6 +59,19 @@ class RiskScore(BaseModel):
     liquidity_component: float
     breakdown: dict[str, float]
 
+    # RiskScorer keeps raw floats; round once at the JSON boundary
+    @field_serializer(
+        "composite_score", "iv_rank_component", "bid_ask_component",
+        "fundamental_component", "sentiment_component", "liquidity_component",
+        when_used="json",
+    )
+    def _round_component(self, v: float) -> float:
+        return round(v, 2)
+
+    @field_serializer("breakdown", when_used="json")
+    def _round_breakdown(self, v: dict[str, float]) -> dict[str, float]:
+        return {k: round(x, 2) for k, x in v.items()}
+
 
 class RankedSpread(BaseModel):
     rank: int
@@ -0,0 +1,113 @@
+"""
+Debit-spread pair enumeration kernel for SpreadConstructor.
+
+Given one expiry's legs sorted in build order (ascending strike for calls,
+descending for puts), pairs long leg i with short legs i+1..i+max_width_strikes
+and returns parallel arrays for the surviving pairs only:
+    (long_idx, short_idx, net_debit, spread_width, max_profit, breakeven, pop)
+
+numba is optional. When installed, the loop-style kernel is JIT-compiled; a
+compiled scalar loop beats NumPy's (n, n) broadcast here because most of the
+matrix is outside the width band. Without numba the NumPy version is used —
+the loop kernel would be far slower as plain Python.
+"""
+
+import logging
+import math
+
+import numpy as np
+
+from backend.scanner.greeks_calculator import compute_probability_of_profit_batch
+
+logger = logging.getLogger(__name__)
+
+_SQRT2 = math.sqrt(2.0)
+
+
+def _enumerate_debit_pairs_loop(strike, bid, ask, iv, spot, dte, max_width_strikes, bearish):
+    n = strike.shape[0]
+    cap = n * max_width_strikes
+    long_idx = np.empty(cap, dtype=np.int64)
+    short_idx = np.empty(cap, dtype=np.int64)
+    net_debit = np.empty(cap, dtype=np.float64)
+    spread_width = np.empty(cap, dtype=np.float64)
+    max_profit = np.empty(cap, dtype=np.float64)
+    breakeven = np.empty(cap, dtype=np.float64)
+    pop = np.empty(cap, dtype=np.float64)
+
+    T = max(dte / 365.0, 1.0 / 365.0)
+    sqrt_T = math.sqrt(T)
+    count = 0
+    for i in range(n):
+        for j in range(i + 1, min(n, i + 1 + max_width_strikes)):
+            if bid[j] <= 0:
+                continue  # short leg must have a market
+            nd = round(ask[i] - bid[j], 4)
+            if nd <= 0:
+                continue  # would be a credit — not a debit spread
+            w = round(abs(strike[j] - strike[i]), 2)
+            mp = round(w - nd, 4)
+            if mp <= 0:
+                continue  # unfavorable: cost >= width
+            be = round(strike[i] - nd, 4) if bearish else round(strike[i] + nd, 4)
+
+            # PoP from the long leg IV; normal CDF via erf
+            sigma = iv[i]
+            if sigma > 0 and spot > 0 and be > 0:
+                d2 = (math.log(spot / be) - 0.5 * sigma * sigma * T) / (sigma * sqrt_T)
+                p = round(min(0.99, max(0.01, 0.5 * (1.0 + math.erf(d2 / _SQRT2)))), 4)
+            else:
+                p = 0.5
+            if bearish:
+                p = round(min(0.99, max(0.01, 1.0 - p)), 4)
+
+            long_idx[count] = i
+            short_idx[count] = j
+            net_debit[count] = nd
+            spread_width[count] = w
+            max_profit[count] = mp
+            breakeven[count] = be
+            pop[count] = p
+            count += 1
+
+    return (
+        long_idx[:count], short_idx[:count], net_debit[:count], spread_width[:count],
+        max_profit[:count], breakeven[:count], pop[:count],
+    )
+
+
+def _enumerate_debit_pairs_numpy(strike, bid, ask, iv, spot, dte, max_width_strikes, bearish):
+    n = strike.shape[0]
+    offset = np.arange(n)[None, :] - np.arange(n)[:, None]
+    net_debit = np.round(ask[:, None] - bid[None, :], 4)
+    spread_width = np.round(np.abs(strike[None, :] - strike[:, None]), 2)
+    max_profit = np.round(spread_width - net_debit, 4)
+
+    mask = (
+        (offset >= 1) & (offset <= max_width_strikes)
+        & (bid[None, :] > 0)     # short leg must have a market
+        & (net_debit > 0)        # otherwise a credit — not a debit spread
+        & (max_profit > 0)       # unfavorable: cost >= width
+    )
+    long_idx, short_idx = np.nonzero(mask)
+    net_debit = net_debit[mask]
+
+    sign = -1.0 if bearish else 1.0
+    breakeven = np.round(strike[long_idx] + sign * net_debit, 4)
+    pop = compute_probability_of_profit_batch(breakeven, spot, iv[long_idx], dte)
+    if bearish:
+        pop = np.round(np.clip(1.0 - pop, 0.01, 0.99), 4)
+
+    return long_idx, short_idx, net_debit, spread_width[mask], max_profit[mask], breakeven, pop
+
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    enumerate_debit_pairs = njit(cache=True)(_enumerate_debit_pairs_loop)
+else:
+    logger.debug("numba not installed — using NumPy spread enumeration")
+    enumerate_debit_pairs = _enumerate_debit_pairs_numpy
@@ -33,17 +33,18 @@ class FundamentalsScorer:
 
     def score(self, fund: FundamentalData) -> FundamentalData:
         """Compute and attach fundamental_score to the model. Returns updated model."""
-        components = {
-            "pe": self._pe_score(fund.pe_ratio),
-            "growth": self._growth_score(fund.revenue_growth_yoy, fund.earnings_growth_yoy),
-            "debt": self._debt_score(fund.debt_to_equity),
-            "margin": self._margin_score(fund.gross_margin, fund.operating_margin),
-            "roe": self._roe_score(fund.return_on_equity),
-            "fcf": self._fcf_score(fund.free_cash_flow_yield),
-        }
-
-        composite = sum(components[k] * self.WEIGHTS[k] for k in components)
-        fund.fundamental_score = round(composite, 2)
+        pe = self._pe_score(fund.pe_ratio)
+        growth = self._growth_score(fund.revenue_growth_yoy, fund.earnings_growth_yoy)
+        debt = self._debt_score(fund.debt_to_equity)
+        margin = self._margin_score(fund.gross_margin, fund.operating_margin)
+        roe = self._roe_score(fund.return_on_equity)
+        fcf = self._fcf_score(fund.free_cash_flow_yield)
+        composite = (
+            pe * _W_PE + growth * _W_GROWTH + debt * _W_DEBT
+            + margin * _W_MARGIN + roe * _W_ROE + fcf * _W_FCF
+        )
+        # Raw float; FundamentalData rounds at JSON serialization
+        fund.fundamental_score = composite
         return fund
 
     @staticmethod
@@ -169,3 +170,12 @@ class FundamentalsScorer:
         if fcf_yield >= 0.0:
             return fcf_yield / 0.04 * 60
         return max(0.0, 20.0 + fcf_yield * 200)  # negative FCF
+
+
+# Derived once from FundamentalsScorer.WEIGHTS for the unrolled sum in score()
+_W_PE = FundamentalsScorer.WEIGHTS["pe"]
+_W_GROWTH = FundamentalsScorer.WEIGHTS["growth"]
+_W_DEBT = FundamentalsScorer.WEIGHTS["debt"]
+_W_MARGIN = FundamentalsScorer.WEIGHTS["margin"]
+_W_ROE = FundamentalsScorer.WEIGHTS["roe"]
+_W_FCF = FundamentalsScorer.WEIGHTS["fcf"]
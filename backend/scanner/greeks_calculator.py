@@ -2,11 +2,23 @@
 Black-Scholes option greeks calculator.
 Used to compute delta, gamma, theta, vega, rho from yfinance chain data
 since yfinance does not provide greeks natively.
+
+Scalar vs batched paths — keep them separate:
+    - Scalar functions (compute_greeks, compute_probability_of_profit) use
+      math.log/math.sqrt/math.exp. Calling np.* on a Python float wraps it in a
+      0-d array and costs ~1µs per call, which is slower than math.* for single values.
+    - Batched functions (*_batch) use np.log/np.sqrt/np.exp on whole arrays.
+    - Both paths use scipy.special.ndtr for the normal CDF (never
+      scipy.stats.norm.cdf, whose generic distribution machinery dominates small
+      inputs). On a scalar it returns a NumPy float, hence the float() casts.
 """
 
 import math
 
-from scipy.stats import norm
+import numpy as np
+from scipy.special import ndtr
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
 
 
 def compute_greeks(
@@ -34,50 +46,94 @@ def compute_greeks(
     if T <= 0 or sigma <= 0 or S <= 0 or K <= 0:
         return {"delta": 0.0, "gamma": 0.0, "theta": 0.0, "vega": 0.0, "rho": 0.0}
 
-    d1 = (math.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
-    d2 = d1 - sigma * math.sqrt(T)
+    sqrt_T = math.sqrt(T)
+    exp_neg_rT = math.exp(-r * T)
+    sigma_sqrt_T = sigma * sqrt_T
+    d1 = (math.log(S / K) + (r + 0.5 * sigma**2) * T) / sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
 
     is_call = option_type.lower() == "call"
-    sign = 1 if is_call else -1
+    pdf_d1 = _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1)
 
-    # Delta
-    delta = float(norm.cdf(sign * d1)) * sign
-    # For puts: delta = N(d1) - 1, which equals -N(-d1)
-    if not is_call:
-        delta = float(norm.cdf(d1)) - 1.0
+    # Delta — for puts: N(d1) - 1, which equals -N(-d1)
+    delta = float(ndtr(d1)) if is_call else float(ndtr(d1)) - 1.0
 
     # Gamma (same for calls and puts)
-    gamma = float(norm.pdf(d1)) / (S * sigma * math.sqrt(T))
+    gamma = pdf_d1 / (S * sigma_sqrt_T)
 
     # Theta (per calendar day, not annualized)
-    theta_call = (
-        -(S * float(norm.pdf(d1)) * sigma) / (2 * math.sqrt(T))
-        - r * K * math.exp(-r * T) * float(norm.cdf(d2))
-    ) / 365
+    decay = -(S * pdf_d1 * sigma) / (2 * sqrt_T)
     if is_call:
-        theta = theta_call
+        theta = (decay - r * K * exp_neg_rT * float(ndtr(d2))) / 365
     else:
-        theta = (
-            -(S * float(norm.pdf(d1)) * sigma) / (2 * math.sqrt(T))
-            + r * K * math.exp(-r * T) * float(norm.cdf(-d2))
-        ) / 365
+        theta = (decay + r * K * exp_neg_rT * float(ndtr(-d2))) / 365
 
     # Vega (per 1% change in IV)
-    vega = S * float(norm.pdf(d1)) * math.sqrt(T) / 100
+    vega = S * pdf_d1 * sqrt_T / 100
 
     # Rho (per 1% change in interest rate)
     if is_call:
-        rho = K * T * math.exp(-r * T) * float(norm.cdf(d2)) / 100
+        rho = K * T * exp_neg_rT * float(ndtr(d2)) / 100
+    else:
+        rho = -K * T * exp_neg_rT * float(ndtr(-d2)) / 100
+
+    # Raw floats; OptionQuote rounds greeks at JSON serialization
+    return {"delta": delta, "gamma": gamma, "theta": theta, "vega": vega, "rho": rho}
+
+
+def compute_greeks_batch(
+    S: np.ndarray | float,
+    K: np.ndarray,
+    T: np.ndarray | float,
+    r: float,
+    sigma: np.ndarray,
+    option_type: str,
+) -> dict[str, np.ndarray]:
+    """
+    Vectorized compute_greeks over arrays of strikes/IVs (S and T may be scalars,
+    e.g. one spot and one expiry per chain). Rows the scalar path rejects return
+    all-zero greeks; NaN inputs pass that guard there too and yield NaN greeks.
+    """
+    K = np.asarray(K, dtype=np.float64)
+    sigma = np.asarray(sigma, dtype=np.float64)
+    S = np.broadcast_to(np.asarray(S, dtype=np.float64), K.shape)
+    T = np.broadcast_to(np.asarray(T, dtype=np.float64), K.shape)
+
+    # Negated form of the scalar guard, so NaN rows stay valid (and NaN) as they do there
+    valid = ~((T <= 0) | (sigma <= 0) | (S <= 0) | (K <= 0))
+    # Substitute harmless values on invalid rows so log/divide never warn
+    S_ = np.where(valid, S, 1.0)
+    K_ = np.where(valid, K, 1.0)
+    T_ = np.where(valid, T, 1.0)
+    sig = np.where(valid, sigma, 1.0)
+
+    sqrt_T = np.sqrt(T_)
+    exp_neg_rT = np.exp(-r * T_)
+    sigma_sqrt_T = sig * sqrt_T
+    d1 = (np.log(S_ / K_) + (r + 0.5 * sig * sig) * T_) / sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
+    pdf_d1 = _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1)
+    decay = -(S_ * pdf_d1 * sig) / (2 * sqrt_T)
+
+    if option_type.lower() == "call":
+        n_d2 = ndtr(d2)
+        delta = ndtr(d1)
+        theta = (decay - r * K_ * exp_neg_rT * n_d2) / 365
+        rho = K_ * T_ * exp_neg_rT * n_d2 / 100
     else:
-        rho = -K * T * math.exp(-r * T) * float(norm.cdf(-d2)) / 100
-
-    return {
-        "delta": round(delta, 6),
-        "gamma": round(gamma, 6),
-        "theta": round(theta, 6),
-        "vega": round(vega, 6),
-        "rho": round(rho, 6),
+        n_neg_d2 = ndtr(-d2)
+        delta = ndtr(d1) - 1.0
+        theta = (decay + r * K_ * exp_neg_rT * n_neg_d2) / 365
+        rho = -K_ * T_ * exp_neg_rT * n_neg_d2 / 100
+
+    greeks = {
+        "delta": delta,
+        "gamma": pdf_d1 / (S_ * sigma_sqrt_T),
+        "theta": theta,
+        "vega": S_ * pdf_d1 * sqrt_T / 100,
+        "rho": rho,
     }
+    return {k: np.where(valid, v, 0.0) for k, v in greeks.items()}
 
 
 def compute_probability_of_profit(
@@ -92,5 +148,31 @@ def compute_probability_of_profit(
         return 0.5
 
     d2 = (math.log(spot / breakeven) - 0.5 * iv**2 * T) / (iv * math.sqrt(T))
-    pop = float(norm.cdf(d2))
+    pop = float(ndtr(d2))
     return round(max(0.01, min(0.99, pop)), 4)
+
+
+def compute_probability_of_profit_batch(
+    breakeven: np.ndarray,
+    spot: np.ndarray | float,
+    iv: np.ndarray,
+    dte: np.ndarray | int,
+) -> np.ndarray:
+    """
+    Vectorized compute_probability_of_profit over parallel arrays.
+    spot and dte may be scalars (one underlying / one expiry per call).
+    Invalid rows (non-positive iv, spot or breakeven) return 0.5, matching the scalar path.
+    """
+    breakeven = np.asarray(breakeven, dtype=np.float64)
+    spot = np.asarray(spot, dtype=np.float64)
+    iv = np.asarray(iv, dtype=np.float64)
+    T = np.maximum(np.asarray(dte, dtype=np.float64) / 365.0, 1 / 365.0)
+
+    valid = (iv > 0) & (spot > 0) & (breakeven > 0)
+    # Substitute harmless values on invalid rows so log/divide never warn
+    safe_iv = np.where(valid, iv, 1.0)
+    safe_ratio = np.where(valid, spot / np.where(valid, breakeven, 1.0), 1.0)
+
+    d2 = (np.log(safe_ratio) - 0.5 * safe_iv * safe_iv * T) / (safe_iv * np.sqrt(T))
+    pop = np.clip(ndtr(d2), 0.01, 0.99)
+    return np.round(np.where(valid, pop, 0.5), 4)
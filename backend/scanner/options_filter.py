@@ -26,30 +26,29 @@ class OptionsFilter:
         Returns only quotes that pass all liquidity and DTE requirements.
         """
         today = date.today()
-        result = []
 
         is_leaps = strategy in (SpreadType.LEAP_CALL, SpreadType.LEAP_PUT)
         min_dte = filters.leaps_min_dte if is_leaps else filters.min_dte
         max_dte = filters.leaps_max_dte if is_leaps else filters.max_dte
 
-        for quote in quotes:
+        # Bind filter attributes to locals — they are read once per quote
+        min_volume = filters.min_volume
+        min_oi = filters.min_open_interest
+        max_spread_pct = filters.max_bid_ask_spread_pct
+
+        def _keep(quote: OptionQuote) -> bool:
             dte = (quote.expiration - today).days
             if dte < min_dte or dte > max_dte:
-                continue
-            if quote.volume < filters.min_volume:
-                continue
-            if quote.open_interest < filters.min_open_interest:
-                continue
-            if quote.bid <= 0 or quote.ask <= 0:
-                continue
-            mid = (quote.bid + quote.ask) / 2
-            if mid > 0:
-                spread_pct = (quote.ask - quote.bid) / mid
-                if spread_pct > filters.max_bid_ask_spread_pct:
-                    continue
-            result.append(quote)
+                return False
+            if quote.volume < min_volume or quote.open_interest < min_oi:
+                return False
+            bid, ask = quote.bid, quote.ask
+            if bid <= 0 or ask <= 0:
+                return False
+            # bid and ask are both positive here, so mid > 0
+            return (ask - bid) / ((bid + ask) / 2) <= max_spread_pct
 
-        return result
+        return [q for q in quotes if _keep(q)]
 
     def filter_for_strategy(
         self,
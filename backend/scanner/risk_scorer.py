@@ -4,10 +4,13 @@ Combines: IV rank, bid-ask quality, fundamentals, sentiment, liquidity.
 Score range 0-100; higher = better risk profile for entering the trade.
 """
 
+import numpy as np
+
 from backend.models.fundamentals import FundamentalData
 from backend.models.options import SpreadCandidate
 from backend.models.scanner import RiskScore
 from backend.models.sentiment import TickerSentiment
+from backend.scanner.scan_frame import ScanFrame
 
 
 class RiskScorer:
@@ -38,24 +41,54 @@ class RiskScorer:
         fundamentals: FundamentalData,
         sentiment: TickerSentiment,
     ) -> RiskScore:
-        components = {
-            "iv_rank": self._iv_rank_score(spread.iv_rank),
-            "bid_ask": self._bid_ask_score(spread.bid_ask_quality_score),
-            "fundamental": fundamentals.fundamental_score or 50.0,
-            "sentiment": sentiment.sentiment_score,
-            "liquidity": self._liquidity_score(spread.long_leg),
-        }
+        iv = self._iv_rank_score(spread.iv_rank)
+        ba = self._bid_ask_score(spread.bid_ask_quality_score)
+        fn = fundamentals.fundamental_score or 50.0
+        se = sentiment.sentiment_score
+        lq = self._liquidity_score(spread.long_leg)
+        composite = (
+            iv * _W_IV_RANK + ba * _W_BID_ASK + fn * _W_FUNDAMENTAL
+            + se * _W_SENTIMENT + lq * _W_LIQUIDITY
+        )
+        return self._build(composite, (iv, ba, fn, se, lq))
 
-        composite = sum(components[k] * self.WEIGHTS[k] for k in self.WEIGHTS)
+    def score_batch(self, frame: ScanFrame) -> list[RiskScore]:
+        """
+        Vectorized score over a ScanFrame, reading frame.fund_score directly.
+        Composites come from a single (n, 5) component matrix dotted with
+        _WEIGHT_VECTOR; columns follow WEIGHTS order.
+        """
+        if len(frame) == 0:
+            return []
+        fund = frame.fund_score
+        components = np.column_stack((
+            np.maximum(0.0, 100.0 - frame.iv_rank),
+            np.clip(frame.ba_quality * 100, 0.0, 100.0),
+            # Mirrors `fundamental_score or 50.0` in the scalar path
+            np.where(np.isnan(fund) | (fund == 0), 50.0, fund),
+            frame.sentiment,
+            np.round(
+                np.minimum(50.0, frame.oi / 1000 * 50) + np.minimum(50.0, frame.vol / 500 * 50), 2
+            ),
+        ))
+        composite = components @ _WEIGHT_VECTOR
+        return [
+            self._build(c, tuple(row))
+            for c, row in zip(composite.tolist(), components.tolist(), strict=True)
+        ]
 
+    @staticmethod
+    def _build(composite: float, components: tuple[float, ...]) -> RiskScore:
+        # Raw floats; RiskScore rounds at JSON serialization
+        iv, ba, fn, se, lq = components
         return RiskScore(
-            composite_score=round(composite, 2),
-            iv_rank_component=round(components["iv_rank"], 2),
-            bid_ask_component=round(components["bid_ask"], 2),
-            fundamental_component=round(components["fundamental"], 2),
-            sentiment_component=round(components["sentiment"], 2),
-            liquidity_component=round(components["liquidity"], 2),
-            breakdown=components,
+            composite_score=composite,
+            iv_rank_component=iv,
+            bid_ask_component=ba,
+            fundamental_component=fn,
+            sentiment_component=se,
+            liquidity_component=lq,
+            breakdown=dict(zip(_COMPONENTS, components, strict=True)),
         )
 
     @staticmethod
@@ -87,3 +120,13 @@ class RiskScorer:
         oi_score = min(50.0, (long_leg.open_interest / 1000) * 50)
         vol_score = min(50.0, (long_leg.volume / 500) * 50)
         return round(oi_score + vol_score, 2)
+
+
+# Derived once from RiskScorer.WEIGHTS: unrolled in score(), stacked for score_batch()
+_COMPONENTS = tuple(RiskScorer.WEIGHTS)
+_WEIGHT_VECTOR = np.array([RiskScorer.WEIGHTS[k] for k in _COMPONENTS])
+_W_IV_RANK = RiskScorer.WEIGHTS["iv_rank"]
+_W_BID_ASK = RiskScorer.WEIGHTS["bid_ask"]
+_W_FUNDAMENTAL = RiskScorer.WEIGHTS["fundamental"]
+_W_SENTIMENT = RiskScorer.WEIGHTS["sentiment"]
+_W_LIQUIDITY = RiskScorer.WEIGHTS["liquidity"]
@@ -0,0 +1,51 @@
+"""
+Columnar (struct-of-arrays) view of scan candidates.
+One row per SpreadCandidate; every column is a parallel float64 array so
+RiskScorer.score_batch can run as a NumPy kernel instead of walking pydantic
+objects. A missing fundamental_score is stored as NaN.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from backend.models.fundamentals import FundamentalData
+from backend.models.options import SpreadCandidate
+from backend.models.sentiment import TickerSentiment
+
+
+@dataclass
+class ScanFrame:
+    # Spread / fundamentals / sentiment / long-leg liquidity
+    iv_rank: np.ndarray
+    ba_quality: np.ndarray
+    fund_score: np.ndarray
+    sentiment: np.ndarray
+    oi: np.ndarray
+    vol: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.iv_rank)
+
+    @classmethod
+    def from_candidates(
+        cls,
+        candidates: list[SpreadCandidate],
+        fundamentals: list[FundamentalData],
+        sentiments: list[TickerSentiment],
+    ) -> "ScanFrame":
+        """Build a frame from parallel lists (one fundamentals/sentiment per candidate)."""
+
+        def col(values) -> np.ndarray:
+            # None → NaN under an explicit float64 dtype
+            return np.array(list(values), dtype=np.float64)
+
+        return cls(
+            iv_rank=col(c.iv_rank for c in candidates),
+            ba_quality=col(c.bid_ask_quality_score for c in candidates),
+            fund_score=col(f.fundamental_score for f in fundamentals),
+            sentiment=col(s.sentiment_score for s in sentiments),
+            oi=col(c.long_leg.open_interest for c in candidates),
+            vol=col(c.long_leg.volume for c in candidates),
+        )
+
@@ -5,11 +5,15 @@ fundamentals, sentiment, ML inference, risk scoring, ranking.
 """
 
 import asyncio
+import heapq
 import logging
 import time
 import uuid
+from collections.abc import Sequence
 from datetime import date, datetime
-from typing import Optional
+from typing import Any, Optional
+
+import numpy as np
 
 from backend.api.cache import RedisCache
 from backend.config.settings import Settings, get_settings
@@ -20,10 +24,11 @@ from backend.data.yfinance_client import YFinanceClient
 from backend.models.fundamentals import FundamentalData
 from backend.models.options import OptionQuote, SpreadCandidate, SpreadType
 from backend.models.scanner import RankedSpread, ScannerFilters, ScannerResult
-from backend.models.sentiment import TickerSentiment
+from backend.models.sentiment import ArticleSentiment, TickerSentiment
 from backend.scanner.fundamentals_scorer import FundamentalsScorer
 from backend.scanner.options_filter import OptionsFilter
 from backend.scanner.risk_scorer import RiskScorer
+from backend.scanner.scan_frame import ScanFrame
 from backend.scanner.spread_constructor import SpreadConstructor
 from backend.scanner.universe import UniverseBuilder
 from backend.ml.outcome_logger import OutcomeLogger
@@ -34,6 +39,8 @@ logger = logging.getLogger(__name__)
 
 # FMP rate limit — free tier is 250 calls/day; keep at 1 concurrent
 FMP_SEMAPHORE = asyncio.Semaphore(1)
+# Max texts per FinBERT call when scoring all symbols' news in one pass
+SENTIMENT_MAX_BATCH = 256
 # yfinance concurrency is managed per-call inside yfinance_client._run_sync
 
 
@@ -96,8 +103,22 @@ class OptionsScanner:
         symbols = await self.universe_builder.build(filters)
         logger.info("Scanning %d symbols", len(symbols))
 
-        # Stage 2+3: Options chains + filter + spread construction
-        all_candidates = await self._fetch_and_construct(symbols, filters)
+        # Stage 2+3 → 4+5 pipelined: each symbol's candidates are queued as soon as
+        # they are built, and its fundamentals + sentiment fetches start right away
+        # (overlapping FMP/news latency with the remaining chain fetches).
+        candidates_q: asyncio.Queue = asyncio.Queue()
+        enrich_task = asyncio.create_task(self._enrich_from_queue(candidates_q))
+        try:
+            all_candidates = await self._fetch_and_construct(symbols, filters, candidates_q)
+        except BaseException:
+            # Never leave the consumer unawaited: cancel it and reap its outcome so
+            # the original error propagates and nothing is lost as "never retrieved"
+            enrich_task.cancel()
+            await asyncio.gather(enrich_task, return_exceptions=True)
+            raise
+        finally:
+            candidates_q.put_nowait(None)  # sentinel: no more symbols
+        fundamentals_map, sentiment_map = await enrich_task
         logger.info("Constructed %d spread candidates", len(all_candidates))
 
         if not all_candidates:
@@ -110,17 +131,22 @@ class OptionsScanner:
                 scan_duration_seconds=round(time.time() - start_time, 2),
             )
 
-        unique_symbols = list({c.underlying for c in all_candidates})
+        # Ordered dedupe: stable symbol order (and cache-key order) across scans
+        unique_symbols = list(dict.fromkeys(c.underlying for c in all_candidates))
 
-        # Stage 4: Fundamentals
-        fundamentals_map = await self._fetch_fundamentals(unique_symbols)
+        # Fill defaults once per missing symbol so every later stage can index the
+        # maps directly (allocations stay O(symbols), not O(candidates))
+        for sym in unique_symbols:
+            if sym not in fundamentals_map:
+                fundamentals_map[sym] = FundamentalData(symbol=sym)
+            if sym not in sentiment_map:
+                sentiment_map[sym] = _neutral_sentiment(sym)
 
         # Propagate earnings data from fundamentals to each candidate
         for cand in all_candidates:
-            fund = fundamentals_map.get(cand.underlying)
-            if fund:
-                cand.days_to_earnings = fund.days_to_earnings
-                cand.next_earnings_date = fund.next_earnings_date
+            fund = fundamentals_map[cand.underlying]
+            cand.days_to_earnings = fund.days_to_earnings
+            cand.next_earnings_date = fund.next_earnings_date
 
         # Earnings proximity filter — drop candidates that don't meet the window
         # when earnings_play=True; for earnings strategy types always enforce window.
@@ -153,9 +179,6 @@ class OptionsScanner:
                 filters.earnings_min_days, filters.earnings_max_days,
             )
 
-        # Stage 5: Sentiment
-        sentiment_map = await self._fetch_sentiment(unique_symbols)
-
         # Populate IV rank on each candidate now that we have it
         iv_rank_map = await self._fetch_iv_ranks(unique_symbols, all_candidates)
         for cand in all_candidates:
@@ -169,36 +192,35 @@ class OptionsScanner:
             cand.iv_52w_high = iv_high
             cand.iv_52w_low = iv_low
 
-        # Stage 6: ML inference — build full 23-feature vectors, use predict_from_features
-        from backend.ml.features import FeatureEngineer
+        # Join each candidate to its symbol's fundamentals/sentiment once for stages 6-8
+        cand_funds = [fundamentals_map[cand.underlying] for cand in all_candidates]
+        cand_sents = [sentiment_map[cand.underlying] for cand in all_candidates]
+
+        # Stage 6: ML inference — fill one contiguous (n, 23) feature matrix, predict_matrix
+        from backend.ml.features import N_FEATURES, FeatureEngineer
         if self._feature_engineer is None:
             self._feature_engineer = FeatureEngineer()
-        feature_vectors = [
-            self._feature_engineer.build(
+        X = np.empty((len(all_candidates), N_FEATURES), dtype=np.float64)
+        for k, (cand, fund, sent) in enumerate(
+            zip(all_candidates, cand_funds, cand_sents, strict=True)
+        ):
+            X[k] = self._feature_engineer.build_row(
                 spread=cand,
-                fundamentals=fundamentals_map.get(cand.underlying, FundamentalData(symbol=cand.underlying)),
-                sentiment=sentiment_map.get(cand.underlying, _neutral_sentiment(cand.underlying)),
+                fundamentals=fund,
+                sentiment=sent,
                 spot_price=cand.spot_price,
                 hv_30d=cand.hv_30d or 0.30,
                 iv_52w_high=cand.iv_52w_high or 0.60,
                 iv_52w_low=cand.iv_52w_low or 0.15,
             )
-            for cand in all_candidates
-        ]
-        ml_predictions = self.ml_ranker.predict_from_features(feature_vectors)
+        ml_predictions = self.ml_ranker.predict_matrix(X)
 
-        # Stage 7: Risk scoring
-        risk_scores = []
-        for cand in all_candidates:
-            fund = fundamentals_map.get(cand.underlying, FundamentalData(symbol=cand.underlying))
-            sent = sentiment_map.get(cand.underlying, _neutral_sentiment(cand.underlying))
-            risk_scores.append(self.risk_scorer.score(cand, fund, sent))
-
-        # Stage 8: Apply ML filter + rank
+        # Stage 7+8 fused: apply the cheap ML/IV/PoP/fundamental/sentiment gates
+        # first, then risk-score only the survivors (one batch) and build results
         reject_ml = reject_pop = reject_fund = reject_sent = 0
-        ranked = []
-        for i, (cand, ml_pred, risk) in enumerate(
-            zip(all_candidates, ml_predictions, risk_scores)
+        keep: list[int] = []
+        for i, (cand, ml_pred, fund, sent) in enumerate(
+            zip(all_candidates, ml_predictions, cand_funds, cand_sents, strict=True)
         ):
             # Post-ML quality filter
             if ml_pred.spread_quality_score < filters.min_ml_quality_score:
@@ -210,43 +232,50 @@ class OptionsScanner:
             if cand.probability_of_profit < filters.min_probability_of_profit:
                 reject_pop += 1
                 continue
-            fund = fundamentals_map.get(cand.underlying, FundamentalData(symbol=cand.underlying))
-            sent = sentiment_map.get(cand.underlying, _neutral_sentiment(cand.underlying))
             if (fund.fundamental_score or 0) < filters.min_fundamental_score:
                 reject_fund += 1
                 continue
             if sent.sentiment_score < filters.min_sentiment_score:
                 reject_sent += 1
                 continue
-
-            ranked.append(
+            keep.append(i)
+
+        ranked: list[RankedSpread] = []
+        if keep:
+            frame = ScanFrame.from_candidates(
+                [all_candidates[i] for i in keep],
+                [cand_funds[i] for i in keep],
+                [cand_sents[i] for i in keep],
+            )
+            risk_scores = self.risk_scorer.score_batch(frame)
+            ranked = [
                 RankedSpread(
                     rank=0,  # filled below
-                    spread=cand,
-                    fundamentals=fund,
-                    sentiment=sent,
-                    ml_prediction=ml_pred,
+                    spread=all_candidates[i],
+                    fundamentals=cand_funds[i],
+                    sentiment=cand_sents[i],
+                    ml_prediction=ml_predictions[i],
                     risk_score=risk,
                 )
-            )
-
-        # Sort by ML quality score descending
-        ranked.sort(key=lambda x: x.ml_prediction.spread_quality_score, reverse=True)
+                for i, risk in zip(keep, risk_scores, strict=True)
+            ]
 
-        # Apply per-symbol diversity cap (keeps best N spreads per ticker)
-        symbol_counts: dict[str, int] = {}
-        diverse: list = []
+        # Apply per-symbol diversity cap (keeps best N spreads per ticker), then take
+        # the top max_results by ML quality score. Bounded heaps instead of a full
+        # sort; nlargest is stable, so ties keep candidate order as before.
+        by_symbol: dict[str, list[RankedSpread]] = {}
         for item in ranked:
-            sym = item.spread.underlying
-            count = symbol_counts.get(sym, 0)
-            if count >= filters.max_results_per_symbol:
-                continue
-            symbol_counts[sym] = count + 1
-            diverse.append(item)
-        ranked = diverse
+            by_symbol.setdefault(item.spread.underlying, []).append(item)
+        kept = {
+            id(item)
+            for items in by_symbol.values()
+            for item in heapq.nlargest(filters.max_results_per_symbol, items, key=_ml_score)
+        }
+        ranked = [item for item in ranked if id(item) in kept]
+        top = heapq.nlargest(filters.max_results, ranked, key=_ml_score)
 
         # Assign final ranks
-        for i, item in enumerate(ranked):
+        for i, item in enumerate(top):
             item.rank = i + 1
 
         logger.info(
@@ -269,7 +298,7 @@ class OptionsScanner:
             scan_time=datetime.utcnow().isoformat(),
             filters_used=filters,
             total_candidates_evaluated=len(all_candidates),
-            results=ranked[: filters.max_results],
+            results=top,
             scan_duration_seconds=round(time.time() - start_time, 2),
         )
 
@@ -306,15 +335,46 @@ class OptionsScanner:
     # ------------------------------------------------------------------
 
     async def _fetch_and_construct(
-        self, symbols: list[str], filters: ScannerFilters
+        self,
+        symbols: Sequence[str],
+        filters: ScannerFilters,
+        candidates_q: Optional[asyncio.Queue] = None,
     ) -> list[SpreadCandidate]:
-        """Stage 2+3: Fetch options chains and construct spreads for all symbols."""
+        """
+        Stage 2+3: Fetch options chains and construct spreads for all symbols.
+        If candidates_q is given, each symbol's (symbol, spreads) is also put on it
+        as soon as that symbol finishes. Returns candidates in symbol order.
+        """
+        # One date for the whole scan: DTE stays consistent across a midnight rollover
+        today = date.today()
+
+        # Strategy flags and DTE windows are per scan, not per symbol
+        strategies = set(filters.strategies)
+        has_near_term = bool(strategies & _NEAR_TERM_TYPES)
+        has_leaps = bool(strategies & _LEAPS_TYPES)
+        # Most symbols share the same listed expirations — decide each date once
+        expiry_ok: dict[str, bool] = {}
+
+        def expiry_in_window(exp: str) -> bool:
+            ok = expiry_ok.get(exp)
+            if ok is None:
+                try:
+                    dte = (date.fromisoformat(exp) - today).days
+                except ValueError:
+                    ok = False
+                else:
+                    ok = (
+                        (has_near_term and filters.min_dte <= dte <= filters.max_dte)
+                        or (has_leaps and filters.leaps_min_dte <= dte <= filters.leaps_max_dte)
+                    )
+                expiry_ok[exp] = ok
+            return ok
 
         async def process_symbol(symbol: str) -> list[SpreadCandidate]:
             try:
-                # --- Quote (cached 60s) ---
+                # --- Quote (cached 60s; prefetched by MGET below) ---
                 quote_key = f"quote:{symbol}"
-                quote = await self.cache.get(quote_key)
+                quote = cached_quotes.get(symbol)
                 if not quote:
                     quote = await self._get_quote(symbol)
                     await self.cache.set(quote_key, quote, self.settings.CACHE_TTL_QUOTES)
@@ -324,9 +384,9 @@ class OptionsScanner:
                 if spot <= 0:
                     return []
 
-                # --- Expirations (cached 5m) ---
+                # --- Expirations (cached 5m; prefetched by MGET below) ---
                 exp_key = f"expirations:{symbol}"
-                expirations = await self.cache.get(exp_key)
+                expirations = cached_expirations.get(symbol)
                 if not expirations:
                     expirations = await self._get_expirations(symbol)
                     await self.cache.set(exp_key, expirations, self.settings.CACHE_TTL_CHAINS)
@@ -336,35 +396,7 @@ class OptionsScanner:
                 all_spreads: list[SpreadCandidate] = []
 
                 # Pre-filter expirations by DTE
-                today = date.today()
-                has_spread_strategies = any(
-                    s in filters.strategies
-                    for s in [SpreadType.BULL_CALL, SpreadType.BEAR_PUT]
-                )
-                has_leaps_strategies = any(
-                    s in filters.strategies
-                    for s in [SpreadType.LEAP_CALL, SpreadType.LEAP_PUT, SpreadType.LEAPS_SPREAD_CALL]
-                )
-                has_earnings_strategies = any(
-                    s in filters.strategies
-                    for s in [SpreadType.EARNINGS_CALL, SpreadType.EARNINGS_PUT]
-                )
-
-                valid_expiries: list[str] = []
-                for exp in expirations:
-                    try:
-                        dte = (date.fromisoformat(exp) - today).days
-                    except ValueError:
-                        continue
-                    include = False
-                    if has_spread_strategies and filters.min_dte <= dte <= filters.max_dte:
-                        include = True
-                    if has_leaps_strategies and filters.leaps_min_dte <= dte <= filters.leaps_max_dte:
-                        include = True
-                    if has_earnings_strategies and filters.min_dte <= dte <= filters.max_dte:
-                        include = True
-                    if include:
-                        valid_expiries.append(exp)
+                valid_expiries = [exp for exp in expirations if expiry_in_window(exp)]
 
                 for expiry in valid_expiries[:5]:  # limit to 5 per symbol
                     try:
@@ -381,8 +413,8 @@ class OptionsScanner:
                             if calls or puts:
                                 await self.cache.set(
                                     chain_key,
-                                    {"calls": [q.model_dump(mode="json") for q in calls],
-                                     "puts":  [q.model_dump(mode="json") for q in puts]},
+                                    {"calls": [q.model_dump() for q in calls],
+                                     "puts":  [q.model_dump() for q in puts]},
                                     self.settings.CACHE_TTL_CHAINS,
                                 )
                             else:
@@ -393,6 +425,7 @@ class OptionsScanner:
                             puts=puts,
                             strategies=filters.strategies,
                             spot_price=spot,
+                            today=today,
                         )
                         ba_filtered = [
                             s for s in spreads
@@ -421,7 +454,22 @@ class OptionsScanner:
                 logger.warning("Failed to process %s: %s", symbol, e)
                 return []
 
-        tasks = [process_symbol(sym) for sym in symbols]
+        # Warm-cache quotes and expirations for every symbol in two MGETs up front;
+        # only misses go out to Schwab/yfinance (and take rate-limiter tokens)
+        cached_quotes = dict(zip(
+            symbols, await self.cache.mget([f"quote:{s}" for s in symbols]), strict=True
+        ))
+        cached_expirations = dict(zip(
+            symbols, await self.cache.mget([f"expirations:{s}" for s in symbols]), strict=True
+        ))
+
+        async def process_and_publish(symbol: str) -> list[SpreadCandidate]:
+            spreads = await process_symbol(symbol)
+            if candidates_q is not None:
+                candidates_q.put_nowait((symbol, spreads))
+            return spreads
+
+        tasks = [process_and_publish(sym) for sym in symbols]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         all_candidates: list[SpreadCandidate] = []
@@ -433,37 +481,88 @@ class OptionsScanner:
 
         return all_candidates
 
+    async def _enrich_from_queue(
+        self, candidates_q: asyncio.Queue
+    ) -> tuple[dict[str, FundamentalData], dict[str, TickerSentiment]]:
+        """
+        Stage 4+5 consumer: drain (symbol, spreads) items until the None sentinel.
+        Every symbol that arrived together with candidates is fetched as one
+        micro-batch, so the MGET batching in _fetch_fundamentals/_fetch_sentiment
+        still applies.
+        """
+        fund_tasks: list[asyncio.Task] = []
+        sent_tasks: list[asyncio.Task] = []
+        seen: set[str] = set()
+        done = False
+        try:
+            while not done:
+                batch: list[str] = []
+                item = await candidates_q.get()
+                while True:
+                    if item is None:
+                        done = True
+                        break
+                    symbol, spreads = item
+                    if spreads and symbol not in seen:
+                        seen.add(symbol)
+                        batch.append(symbol)
+                    if candidates_q.empty():
+                        break
+                    item = candidates_q.get_nowait()
+                if batch:
+                    fund_tasks.append(asyncio.create_task(self._fetch_fundamentals(batch)))
+                    sent_tasks.append(asyncio.create_task(self._fetch_sentiment(batch)))
+        except asyncio.CancelledError:
+            # Scan aborted upstream: don't leave in-flight fetches running orphaned
+            for task in fund_tasks + sent_tasks:
+                task.cancel()
+            raise
+
+        fundamentals_map: dict[str, FundamentalData] = {}
+        for part in await asyncio.gather(*fund_tasks):
+            fundamentals_map.update(part)
+        sentiment_map: dict[str, TickerSentiment] = {}
+        for part in await asyncio.gather(*sent_tasks):
+            sentiment_map.update(part)
+        return fundamentals_map, sentiment_map
+
     async def _fetch_fundamentals(
         self, symbols: list[str]
     ) -> dict[str, FundamentalData]:
         """Stage 4: Fetch and score fundamentals for all unique symbols (cached)."""
         ttl = self.settings.CACHE_TTL_FUNDAMENTALS
 
+        # One MGET for every symbol; only cache misses go out to FMP
+        output: dict[str, FundamentalData] = {}
+        misses: list[str] = []
+        cached = await self.cache.mget([f"fundamentals:{s}" for s in symbols])
+        for symbol, hit in zip(symbols, cached, strict=True):
+            if hit:
+                output[symbol] = _fundamentals_from_cache(hit)
+            else:
+                misses.append(symbol)
+
         async def fetch_one(symbol: str) -> FundamentalData:
             async with FMP_SEMAPHORE:
-                cache_key = f"fundamentals:{symbol}"
-                cached = await self.cache.get(cache_key)
-                if cached:
-                    return FundamentalData(**cached)
                 fund = await self.fmp.get_full_fundamentals(symbol)
-                fund = self.fundamentals_scorer.score(fund)
-                # Only cache if we got real data. An empty company_name means
-                # FMP returned 429/error — don't cache so the next scan retries.
-                if fund.company_name:
-                    await self.cache.set(cache_key, fund, ttl)
-                return fund
+                return self.fundamentals_scorer.score(fund)
 
-        tasks = [fetch_one(sym) for sym in symbols]
+        tasks = [fetch_one(sym) for sym in misses]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        output = {}
-        for symbol, result in zip(symbols, results):
+        writes: list[tuple[str, Any, int]] = []
+        for symbol, result in zip(misses, results, strict=True):
             if isinstance(result, Exception):
                 logger.warning("Fundamentals error %s: %s", symbol, result)
                 output[symbol] = FundamentalData(symbol=symbol)
             else:
                 output[symbol] = result
-        return output
+                # Only cache if we got real data. An empty company_name means
+                # FMP returned 429/error — don't cache so the next scan retries.
+                if result.company_name:
+                    writes.append((f"fundamentals:{symbol}", result, ttl))
+        await self.cache.pipeline_set(writes)
+        return {s: output[s] for s in symbols}
 
     async def _fetch_sentiment(
         self, symbols: list[str]
@@ -471,79 +570,118 @@ class OptionsScanner:
         """Stage 5: Fetch news and run FinBERT sentiment for all symbols."""
         ttl = self.settings.CACHE_TTL_SENTIMENT
 
-        async def fetch_one(symbol: str) -> TickerSentiment:
-            cache_key = f"sentiment_v2:{symbol}"
-            cached = await self.cache.get(cache_key)
-            if cached:
-                return TickerSentiment(**cached)
-
-            articles = await self.news.get_news(symbol)
-            texts = [
-                (a.title + " " + (a.description or "")).strip()
-                for a in articles
-                if a.title
-            ]
-
-            if not texts:
-                neutral = _neutral_sentiment(symbol)
-                await self.cache.set(cache_key, neutral.model_dump(), ttl)
-                return neutral
+        # One MGET for every symbol; only cache misses fetch news + run FinBERT
+        output: dict[str, TickerSentiment] = {}
+        misses: list[str] = []
+        cached = await self.cache.mget([f"sentiment_v2:{s}" for s in symbols])
+        for symbol, hit in zip(symbols, cached, strict=True):
+            if hit:
+                output[symbol] = _sentiment_from_cache(hit)
+            else:
+                misses.append(symbol)
 
-            scored = await self.sentiment_scorer.score_texts_async(texts)
-            # Filter articles to those with text (same ordering as scored)
+        # News for every miss concurrently; then one flat text list for FinBERT
+        news_results = await asyncio.gather(
+            *[self.news.get_news(sym) for sym in misses], return_exceptions=True
+        )
+        all_texts: list[str] = []
+        # (symbol, scored_articles, headlines, start, end) — slice bounds into all_texts
+        offsets: list[tuple[str, list, list[str], int, int]] = []
+        for symbol, articles in zip(misses, news_results, strict=True):
+            if isinstance(articles, Exception):
+                logger.warning("Sentiment error %s: %s", symbol, articles)
+                output[symbol] = _neutral_sentiment(symbol)
+                continue
+            # Only articles with a title are scored (same ordering as the texts)
             scored_articles = [a for a in articles if a.title]
-            aggregated = self.sentiment_aggregator.aggregate(
-                symbol=symbol,
-                results=scored,
-                articles=scored_articles,
-                headlines=[a.title for a in articles[:5]],
+            start = len(all_texts)
+            all_texts.extend(
+                (a.title + " " + (a.description or "")).strip() for a in scored_articles
             )
-            await self.cache.set(cache_key, aggregated.model_dump(), ttl)
-            return aggregated
-
-        tasks = [fetch_one(sym) for sym in symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            headlines = [a.title for a in articles[:5]]
+            offsets.append((symbol, scored_articles, headlines, start, len(all_texts)))
+
+        # Batched inference across symbols; chunks bound accelerator memory.
+        # A failed chunk leaves None so only the symbols it touched go neutral.
+        scored_flat: list = []
+        for i in range(0, len(all_texts), SENTIMENT_MAX_BATCH):
+            chunk = all_texts[i : i + SENTIMENT_MAX_BATCH]
+            try:
+                scored_flat.extend(await self.sentiment_scorer.score_texts_async(chunk))
+            except Exception as e:
+                logger.warning("Sentiment batch error (%d texts): %s", len(chunk), e)
+                scored_flat.extend([None] * len(chunk))
 
-        output = {}
-        for symbol, result in zip(symbols, results):
-            if isinstance(result, Exception):
-                logger.warning("Sentiment error %s: %s", symbol, result)
+        writes: list[tuple[str, Any, int]] = []
+        now_iso = datetime.utcnow().isoformat()  # one analyzed_at for the whole batch
+        for symbol, scored_articles, headlines, start, end in offsets:
+            cache_key = f"sentiment_v2:{symbol}"
+            try:
+                if start == end:
+                    neutral = _neutral_sentiment(symbol)
+                    writes.append((cache_key, neutral.model_dump(), ttl))
+                    output[symbol] = neutral
+                    continue
+                scored = scored_flat[start:end]
+                if None in scored:
+                    output[symbol] = _neutral_sentiment(symbol)
+                    continue
+                aggregated = self.sentiment_aggregator.aggregate(
+                    symbol=symbol,
+                    results=scored,
+                    articles=scored_articles,
+                    headlines=headlines,
+                    now_iso=now_iso,
+                )
+                writes.append((cache_key, aggregated.model_dump(), ttl))
+                output[symbol] = aggregated
+            except Exception as e:
+                logger.warning("Sentiment error %s: %s", symbol, e)
                 output[symbol] = _neutral_sentiment(symbol)
-            else:
-                output[symbol] = result
-        return output
+        await self.cache.pipeline_set(writes)
+        return {s: output[s] for s in symbols}
 
     async def _fetch_iv_ranks(
         self, symbols: list[str], candidates: list[SpreadCandidate]
     ) -> dict[str, float]:
         """Compute IV rank for each symbol using long leg IV."""
-        # Use the average IV of each symbol's candidates as current IV proxy
-        iv_by_symbol: dict[str, list[float]] = {}
+        # One MGET for every symbol; only cache misses hit yfinance
+        output: dict[str, float] = {}
+        misses: list[str] = []
+        cached = await self.cache.mget([f"iv_rank:{s}" for s in symbols])
+        for symbol, hit in zip(symbols, cached, strict=True):
+            if hit is not None:
+                output[symbol] = float(hit)
+            else:
+                misses.append(symbol)
+        if not misses:
+            return output
+
+        # Use the average IV of each symbol's candidates as current IV proxy:
+        # running (count, total) per symbol in one pass, no per-symbol lists
+        iv_totals: dict[str, tuple[int, float]] = {}
         for cand in candidates:
-            iv_by_symbol.setdefault(cand.underlying, []).append(
-                cand.long_leg.implied_volatility
-            )
+            n, total = iv_totals.get(cand.underlying, (0, 0.0))
+            iv_totals[cand.underlying] = (n + 1, total + cand.long_leg.implied_volatility)
 
         async def compute_one(symbol: str) -> tuple[str, float]:
-            cache_key = f"iv_rank:{symbol}"
-            cached = await self.cache.get(cache_key)
-            if cached is not None:
-                return symbol, float(cached)
-            ivs = iv_by_symbol.get(symbol, [])
-            current_iv = sum(ivs) / len(ivs) if ivs else None
+            n, total = iv_totals.get(symbol, (0, 0.0))
+            current_iv = total / n if n else None
             rank = await self.yf.compute_iv_rank(symbol, current_iv)
-            await self.cache.set(cache_key, rank, self.settings.CACHE_TTL_CHAINS)
             return symbol, rank
 
-        tasks = [compute_one(sym) for sym in symbols]
+        tasks = [compute_one(sym) for sym in misses]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        output = {}
+        ttl = self.settings.CACHE_TTL_CHAINS
+        writes: list[tuple[str, Any, int]] = []
         for result in results:
             if isinstance(result, Exception):
                 continue
             symbol, rank = result
             output[symbol] = rank
+            writes.append((f"iv_rank:{symbol}", rank, ttl))
+        await self.cache.pipeline_set(writes)
         return output
 
 
@@ -627,6 +765,8 @@ def _passes_ba_filter(spread: SpreadCandidate, max_pct: float) -> bool:
 
 _LEAPS_TYPES = {SpreadType.LEAP_CALL, SpreadType.LEAP_PUT, SpreadType.LEAPS_SPREAD_CALL}
 _EARNINGS_TYPES = {SpreadType.EARNINGS_CALL, SpreadType.EARNINGS_PUT}
+# Strategies whose expirations come from the general min/max_dte window
+_NEAR_TERM_TYPES = {SpreadType.BULL_CALL, SpreadType.BEAR_PUT} | _EARNINGS_TYPES
 
 
 def _apply_spread_filters(
@@ -684,6 +824,25 @@ def _apply_spread_filters(
     return out
 
 
+# Cache hits were validated when first written, so they are rebuilt with
+# model_construct (no validators). Only fields that JSON turns into a different
+# type are converted back. If a cached model's schema changes, bump its cache key
+# (e.g. sentiment_v2 → sentiment_v3) so stale entries are never constructed.
+
+def _fundamentals_from_cache(hit: dict) -> FundamentalData:
+    earnings_date = hit.get("next_earnings_date")
+    if isinstance(earnings_date, str):
+        hit["next_earnings_date"] = date.fromisoformat(earnings_date)
+    return FundamentalData.model_construct(**hit)
+
+
+def _sentiment_from_cache(hit: dict) -> TickerSentiment:
+    hit["article_sentiments"] = [
+        ArticleSentiment.model_construct(**a) for a in hit.get("article_sentiments", ())
+    ]
+    return TickerSentiment.model_construct(**hit)
+
+
 def _neutral_sentiment(symbol: str) -> TickerSentiment:
     """Return a neutral (50/50/50) sentiment when news is unavailable."""
     return TickerSentiment(
@@ -698,3 +857,8 @@ def _neutral_sentiment(symbol: str) -> TickerSentiment:
         top_headlines=[],
         analyzed_at=datetime.utcnow().isoformat(),
     )
+
+
+def _ml_score(item: RankedSpread) -> float:
+    """Ranking key: ML spread quality score."""
+    return item.ml_prediction.spread_quality_score
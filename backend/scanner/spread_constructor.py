@@ -5,12 +5,17 @@ Implements: Bull Call Spread, Bear Put Spread, LEAPS (single-leg).
 
 import logging
 from datetime import date
+from operator import attrgetter
+
+import numpy as np
 
 from backend.models.options import OptionQuote, SpreadCandidate, SpreadType
-from backend.scanner.greeks_calculator import compute_probability_of_profit
+from backend.scanner._spread_kernel import enumerate_debit_pairs
 
 logger = logging.getLogger(__name__)
 
+_strike = attrgetter("strike")
+
 # Max number of strikes apart for short leg (keeps spread width reasonable)
 MAX_SPREAD_WIDTH_STRIKES = 5
 
@@ -21,38 +26,54 @@ class SpreadConstructor:
     Returns a flat list of SpreadCandidate objects.
     """
 
+    def __init__(self, max_width_strikes: int = MAX_SPREAD_WIDTH_STRIKES):
+        self.max_width_strikes = max_width_strikes
+
     def build_all_spreads(
         self,
         calls: list[OptionQuote],
         puts: list[OptionQuote],
         strategies: list[SpreadType],
         spot_price: float,
+        today: date = None,
     ) -> list[SpreadCandidate]:
+        if today is None:
+            today = date.today()
+        # Group (and strike-sort) each side once; shared by every strategy below
+        calls_by_expiry = self._group_by_expiry(calls)
+        puts_by_expiry = self._group_by_expiry(puts)
         spreads = []
         for strategy in strategies:
             if strategy == SpreadType.BULL_CALL:
-                spreads.extend(self._build_bull_call_spreads(calls, spot_price))
+                spreads.extend(
+                    self._build_bull_call_spreads(calls_by_expiry, spot_price, today=today)
+                )
             elif strategy == SpreadType.LEAPS_SPREAD_CALL:
                 spreads.extend(
-                    self._build_bull_call_spreads(calls, spot_price, SpreadType.LEAPS_SPREAD_CALL)
+                    self._build_bull_call_spreads(
+                        calls_by_expiry, spot_price, SpreadType.LEAPS_SPREAD_CALL, today=today
+                    )
                 )
             elif strategy == SpreadType.BEAR_PUT:
-                spreads.extend(self._build_bear_put_spreads(puts, spot_price))
+                spreads.extend(
+                    self._build_bear_put_spreads(puts_by_expiry, spot_price, today=today)
+                )
             elif strategy == SpreadType.LEAP_CALL:
-                spreads.extend(self._build_leaps(calls, spot_price, SpreadType.LEAP_CALL))
+                spreads.extend(self._build_leaps(calls, spot_price, SpreadType.LEAP_CALL, today))
             elif strategy == SpreadType.LEAP_PUT:
-                spreads.extend(self._build_leaps(puts, spot_price, SpreadType.LEAP_PUT))
+                spreads.extend(self._build_leaps(puts, spot_price, SpreadType.LEAP_PUT, today))
             elif strategy == SpreadType.EARNINGS_CALL:
-                spreads.extend(self._build_leaps(calls, spot_price, SpreadType.EARNINGS_CALL))
+                spreads.extend(self._build_leaps(calls, spot_price, SpreadType.EARNINGS_CALL, today))
             elif strategy == SpreadType.EARNINGS_PUT:
-                spreads.extend(self._build_leaps(puts, spot_price, SpreadType.EARNINGS_PUT))
+                spreads.extend(self._build_leaps(puts, spot_price, SpreadType.EARNINGS_PUT, today))
         return spreads
 
     def _build_bull_call_spreads(
         self,
-        calls: list[OptionQuote],
+        calls_by_expiry: dict[date, list[OptionQuote]],
         spot: float,
         spread_type: SpreadType = SpreadType.BULL_CALL,
+        today: date = None,
     ) -> list[SpreadCandidate]:
         """
         Bull Call Spread: long lower-strike call + short higher-strike call.
@@ -61,65 +82,24 @@ class SpreadConstructor:
         - Max loss = net_debit
         - Breakeven = long_strike + net_debit
         """
+        if today is None:
+            today = date.today()
         spreads = []
-        # Group by expiration
-        by_expiry = self._group_by_expiry(calls)
-
-        for expiry, legs in by_expiry.items():
-            sorted_legs = sorted(legs, key=lambda x: x.strike)
-            dte = (expiry - date.today()).days
-
-            for i, long_leg in enumerate(sorted_legs):
-
-                # Short leg: must be higher strike, same expiry, within N strikes
-                for short_leg in sorted_legs[i + 1: i + 1 + MAX_SPREAD_WIDTH_STRIKES]:
-                    if short_leg.bid <= 0:
-                        continue
-
-                    net_debit = round(long_leg.ask - short_leg.bid, 4)
-                    if net_debit <= 0:
-                        continue  # would be a credit — not a debit spread
-
-                    spread_width = round(short_leg.strike - long_leg.strike, 2)
-                    max_profit = round(spread_width - net_debit, 4)
-                    if max_profit <= 0:
-                        continue  # unfavorable: cost >= width
-
-                    breakeven = round(long_leg.strike + net_debit, 4)
-
-                    # Use long leg IV for PoP (conservative)
-                    pop = compute_probability_of_profit(
-                        breakeven=breakeven,
-                        spot=spot,
-                        iv=long_leg.implied_volatility,
-                        dte=dte,
-                    )
-
-                    # Bid-ask quality: average of both legs (0=poor, 1=tight)
-                    ba_quality = self._bid_ask_quality(long_leg, short_leg)
-
-                    spreads.append(
-                        SpreadCandidate(
-                            underlying=long_leg.underlying,
-                            spread_type=spread_type,
-                            expiration=expiry,
-                            dte=dte,
-                            long_leg=long_leg,
-                            short_leg=short_leg,
-                            net_debit=net_debit,
-                            max_profit=max_profit,
-                            max_loss=net_debit,
-                            breakeven=breakeven,
-                            probability_of_profit=pop,
-                            bid_ask_quality_score=ba_quality,
-                            iv_rank=0.0,  # filled by scanner after IV rank lookup
-                            spread_width=spread_width,
-                        )
-                    )
+        for expiry, sorted_legs in calls_by_expiry.items():
+            # Short leg: higher strike, same expiry, within N strikes.
+            # PoP uses the long leg IV (conservative).
+            spreads.extend(
+                self._debit_spreads(
+                    sorted_legs, expiry, (expiry - today).days, spot, spread_type, bearish=False,
+                )
+            )
         return spreads
 
     def _build_bear_put_spreads(
-        self, puts: list[OptionQuote], spot: float
+        self,
+        puts_by_expiry: dict[date, list[OptionQuote]],
+        spot: float,
+        today: date = None,
     ) -> list[SpreadCandidate]:
         """
         Bear Put Spread: long higher-strike put + short lower-strike put.
@@ -128,60 +108,72 @@ class SpreadConstructor:
         - Max loss = net_debit
         - Breakeven = long_strike - net_debit
         """
+        if today is None:
+            today = date.today()
         spreads = []
-        by_expiry = self._group_by_expiry(puts)
-
-        for expiry, legs in by_expiry.items():
-            sorted_legs = sorted(legs, key=lambda x: x.strike, reverse=True)
-            dte = (expiry - date.today()).days
-
-            for i, long_leg in enumerate(sorted_legs):
-                # Long leg: at or slightly above the money
-        
-                for short_leg in sorted_legs[i + 1: i + 1 + MAX_SPREAD_WIDTH_STRIKES]:
-                    if short_leg.bid <= 0:
-                        continue
-
-                    net_debit = round(long_leg.ask - short_leg.bid, 4)
-                    if net_debit <= 0:
-                        continue
-
-                    spread_width = round(long_leg.strike - short_leg.strike, 2)
-                    max_profit = round(spread_width - net_debit, 4)
-                    if max_profit <= 0:
-                        continue
-
-                    breakeven = round(long_leg.strike - net_debit, 4)
-
-                    # PoP: prob that stock falls below breakeven
-                    pop = compute_probability_of_profit(
-                        breakeven=breakeven,
-                        spot=spot,
-                        iv=long_leg.implied_volatility,
-                        dte=dte,
-                    )
-                    pop = 1.0 - pop  # bear spread profits on downside
+        for expiry, legs in puts_by_expiry.items():
+            # Short leg: lower strike, same expiry, within N strikes.
+            # PoP: prob that stock falls below breakeven — bear spread profits on downside
+            spreads.extend(
+                self._debit_spreads(
+                    legs[::-1],  # descending strike: long leg is the higher put
+                    expiry, (expiry - today).days, spot, SpreadType.BEAR_PUT, bearish=True,
+                )
+            )
+        return spreads
 
-                    ba_quality = self._bid_ask_quality(long_leg, short_leg)
+    def _debit_spreads(
+        self,
+        sorted_legs: list[OptionQuote],
+        expiry: date,
+        dte: int,
+        spot: float,
+        spread_type: SpreadType,
+        bearish: bool,
+    ) -> list[SpreadCandidate]:
+        """
+        Debit spreads for one expiry. sorted_legs are in build order (long leg
+        first); each long leg pairs with the next max_width_strikes legs.
+        """
+        arrays = self._leg_arrays(sorted_legs)
+        long_idx, short_idx, net_debit, spread_width, max_profit, breakeven, pop = (
+            enumerate_debit_pairs(
+                arrays["strike"], arrays["bid"], arrays["ask"], arrays["iv"],
+                float(spot), dte, self.max_width_strikes, bearish,
+            )
+        )
+        # Bid-ask quality: average of both legs (0=poor, 1=tight)
+        leg_quality = arrays["ba_quality"]
+        ba_quality = np.round((leg_quality[long_idx] + leg_quality[short_idx]) / 2, 4)
 
-                    spreads.append(
-                        SpreadCandidate(
-                            underlying=long_leg.underlying,
-                            spread_type=SpreadType.BEAR_PUT,
-                            expiration=expiry,
-                            dte=dte,
-                            long_leg=long_leg,
-                            short_leg=short_leg,
-                            net_debit=net_debit,
-                            max_profit=max_profit,
-                            max_loss=net_debit,
-                            breakeven=breakeven,
-                            probability_of_profit=round(max(0.01, min(0.99, pop)), 4),
-                            bid_ask_quality_score=ba_quality,
-                            iv_rank=0.0,
-                            spread_width=spread_width,
-                        )
-                    )
+        spreads = []
+        construct = SpreadCandidate.model_construct
+        append = spreads.append
+        for i, j, nd, sw, mp, be, p, baq in zip(
+            long_idx.tolist(), short_idx.tolist(), net_debit.tolist(),
+            spread_width.tolist(), max_profit.tolist(), breakeven.tolist(), pop.tolist(),
+            ba_quality.tolist(), strict=True,
+        ):
+            long_leg = sorted_legs[i]
+            # trusted: computed locally, bypass validation
+            append(
+                construct(
+                    underlying=long_leg.underlying,
+                    spread_type=spread_type,
+                    expiration=expiry,
+                    dte=dte,
+                    long_leg=long_leg,
+                    short_leg=sorted_legs[j],
+                    net_debit=nd,
+                    max_profit=mp,
+                    max_loss=nd,
+                    breakeven=be,
+                    probability_of_profit=p,
+                    bid_ask_quality_score=baq,
+                    iv_rank=0.0,  # filled by scanner after IV rank lookup
+                    spread_width=sw,
+                )
+            )
         return spreads
 
     def _build_leaps(
@@ -189,16 +181,22 @@ class SpreadConstructor:
         options: list[OptionQuote],
         spot: float,
         spread_type: SpreadType,
+        today: date = None,
     ) -> list[SpreadCandidate]:
         """
         Single-leg long call or put. DTE range enforced by scanner pre-filter.
         Selection criteria: delta >= 0.70 (deep ITM, stock replacement).
         """
+        if today is None:
+            today = date.today()
         spreads = []
+        construct = SpreadCandidate.model_construct
+        append = spreads.append
+        quality = self._bid_ask_quality_single
         is_call = spread_type in (SpreadType.LEAP_CALL, SpreadType.EARNINGS_CALL)
 
         for opt in options:
-            dte = (opt.expiration - date.today()).days
+            dte = (opt.expiration - today).days
             premium = opt.ask
             if premium <= 0:
                 continue
@@ -206,8 +204,9 @@ class SpreadConstructor:
             # LEAPS: no short leg, max loss = premium paid
             pop = 0.5  # rough placeholder for single-leg (hard to define simply)
 
-            spreads.append(
-                SpreadCandidate(
+            # trusted: computed locally, bypass validation
+            append(
+                construct(
                     underlying=opt.underlying,
                     spread_type=spread_type,
                     expiration=opt.expiration,
@@ -219,20 +218,52 @@ class SpreadConstructor:
                     max_loss=premium,
                     breakeven=opt.strike + premium if is_call else opt.strike - premium,
                     probability_of_profit=pop,
-                    bid_ask_quality_score=self._bid_ask_quality_single(opt),
+                    bid_ask_quality_score=quality(opt),
                     iv_rank=0.0,
                     spread_width=0.0,
                 )
             )
         return spreads
 
+    @staticmethod
+    def _leg_arrays(sorted_legs: list[OptionQuote]) -> dict[str, np.ndarray]:
+        """
+        Per-expiry leg columns (strike, bid, ask, iv) as float64 arrays in leg order,
+        plus each leg's bid-ask quality (see _leg_quality_vec).
+        """
+        n = len(sorted_legs)
+        bid = np.fromiter((o.bid for o in sorted_legs), dtype=np.float64, count=n)
+        ask = np.fromiter((o.ask for o in sorted_legs), dtype=np.float64, count=n)
+        return {
+            "strike": np.fromiter((o.strike for o in sorted_legs), dtype=np.float64, count=n),
+            "bid": bid,
+            "ask": ask,
+            "iv": np.fromiter(
+                (o.implied_volatility for o in sorted_legs), dtype=np.float64, count=n
+            ),
+            "ba_quality": SpreadConstructor._leg_quality_vec(bid, ask),
+        }
+
+    @staticmethod
+    def _leg_quality_vec(bid: np.ndarray, ask: np.ndarray) -> np.ndarray:
+        """
+        Branchless per-leg form of _bid_ask_quality's leg_quality:
+        max(0, 1 - spread_pct / 0.15), and 0 where mid <= 0.
+        """
+        mid = (bid + ask) / 2
+        spread_pct = (ask - bid) / np.maximum(mid, 1e-9)
+        return np.where(mid > 0, np.maximum(0.0, 1.0 - spread_pct / 0.15), 0.0)
+
     @staticmethod
     def _group_by_expiry(
         options: list[OptionQuote],
     ) -> dict[date, list[OptionQuote]]:
+        """Group legs by expiration; each group is sorted ascending by strike."""
         groups: dict[date, list[OptionQuote]] = {}
         for opt in options:
             groups.setdefault(opt.expiration, []).append(opt)
+        for legs in groups.values():
+            legs.sort(key=_strike)
         return groups
 
     @staticmethod
@@ -8,6 +8,7 @@ Users can override with an explicit symbol list via ScannerFilters.symbols.
 """
 
 import logging
+from collections.abc import Sequence
 
 from backend.models.scanner import ScannerFilters
 
@@ -335,9 +336,10 @@ UNIVERSE_GROUPS: dict[str, list[str]] = {
 }
 
 # ---------------------------------------------------------------------------
-# Final universe — deduplicated, sorted for readability
+# Final universe — deduplicated, sorted for readability. A tuple: immutable, so
+# build() can hand out the shared instance without a defensive copy.
 # ---------------------------------------------------------------------------
-DEFAULT_UNIVERSE: list[str] = sorted(
+DEFAULT_UNIVERSE: tuple[str, ...] = tuple(sorted(
     set(
         _NASDAQ_100
         + _NASDAQ_EXTENDED
@@ -345,7 +347,7 @@ DEFAULT_UNIVERSE: list[str] = sorted(
         + _MSCI_COVERAGE
         + _ETFS
     )
-)
+))
 
 
 class UniverseBuilder:
@@ -354,7 +356,7 @@ class UniverseBuilder:
     Priority: explicit symbols > index_groups > full DEFAULT_UNIVERSE.
     """
 
-    async def build(self, filters: ScannerFilters) -> list[str]:
+    async def build(self, filters: ScannerFilters) -> Sequence[str]:
         if filters.symbols:
             return [s.upper().strip() for s in filters.symbols if s.strip()]
         if filters.index_groups:
@@ -370,4 +372,5 @@ class UniverseBuilder:
         return DEFAULT_UNIVERSE
 
     def get_default_universe(self) -> list[str]:
+        """Mutable copy of DEFAULT_UNIVERSE."""
         return list(DEFAULT_UNIVERSE)
@@ -4,9 +4,14 @@ Aggregates per-article SentimentResult objects into a single TickerSentiment.
 
 from datetime import datetime
 
+import numpy as np
+
 from backend.models.sentiment import ArticleSentiment, NewsArticle, SentimentResult, TickerSentiment
 
 
+_LABELS = ("positive", "negative", "neutral")
+
+
 class SentimentAggregator:
     """
     Aggregation strategy:
@@ -23,37 +28,49 @@ class SentimentAggregator:
         results: list[SentimentResult],
         articles: list[NewsArticle] | None = None,
         headlines: list[str] | None = None,
+        now_iso: str | None = None,
     ) -> TickerSentiment:
+        """now_iso: analyzed_at timestamp; batch callers pass one shared value."""
+        if now_iso is None:
+            now_iso = datetime.utcnow().isoformat()
         if not results:
-            return _neutral_ticker_sentiment(symbol, headlines or [])
+            return _neutral_ticker_sentiment(symbol, headlines or [], now_iso)
 
         n = len(results)
-        avg_pos = sum(r.positive for r in results) / n
-        avg_neg = sum(r.negative for r in results) / n
-        avg_neu = sum(r.neutral for r in results) / n
+        # (n, 3) pos/neg/neu matrix; one vectorized mean instead of three list passes
+        probs = np.fromiter(
+            ((r.positive, r.negative, r.neutral) for r in results),
+            dtype=np.dtype((np.float64, 3)),
+            count=n,
+        )
+        means = probs.mean(axis=0)
+        avg_pos, avg_neg, avg_neu = means.tolist()
         avg_compound = avg_pos - avg_neg
 
-        # Dominant label
-        scores = {"positive": avg_pos, "negative": avg_neg, "neutral": avg_neu}
-        dominant = max(scores, key=lambda k: scores[k])
+        # Dominant label (first of pos/neg/neu on ties)
+        dominant = _LABELS[int(means.argmax())]
 
         # Normalize to 0-100
         sentiment_score = round(((avg_compound + 1) / 2) * 100, 2)
 
         # Build per-article breakdown
-        article_sentiments = []
-        for i, result in enumerate(results):
+        article_sentiments: list[ArticleSentiment] = [None] * n
+        construct = ArticleSentiment.model_construct
+        # One vectorized round for every article row instead of 3n round() calls
+        rounded = np.round(probs, 4).tolist()
+        for i, (result, (pos, neg, neu)) in enumerate(zip(results, rounded, strict=True)):
             art = articles[i] if articles and i < len(articles) else None
-            article_sentiments.append(ArticleSentiment(
+            # trusted: fields come from validated NewsArticle/SentimentResult models
+            article_sentiments[i] = construct(
                 headline=art.title if art else result.text[:100],
                 url=art.url if art else "",
                 published_at=art.published_at if art else "",
                 source=art.source if art else "",
-                positive=round(result.positive, 4),
-                negative=round(result.negative, 4),
-                neutral=round(result.neutral, 4),
+                positive=pos,
+                negative=neg,
+                neutral=neu,
                 label=result.label,
-            ))
+            )
 
         return TickerSentiment(
             symbol=symbol,
@@ -65,7 +82,7 @@ class SentimentAggregator:
             sentiment_label=dominant,
             sentiment_score=sentiment_score,
             top_headlines=(headlines or [])[:5],
-            analyzed_at=datetime.utcnow().isoformat(),
+            analyzed_at=now_iso,
             article_sentiments=article_sentiments,
         )
 
@@ -80,36 +97,47 @@ class SentimentAggregator:
         """
         import asyncio
 
-        symbols = list(symbol_texts.keys())
         all_texts = []
-        offsets: list[tuple[str, int, int]] = []  # (symbol, start, end)
-
-        for symbol in symbols:
-            texts = symbol_texts[symbol]
-            start = len(all_texts)
+        text_symbols: list[str] = []  # owning symbol of each entry in all_texts
+        for symbol, texts in symbol_texts.items():
             all_texts.extend(texts)
-            offsets.append((symbol, start, len(all_texts)))
+            text_symbols.extend([symbol] * len(texts))
 
         all_results = await scorer.score_texts_async(all_texts)
 
-        output = {}
-        for symbol, start, end in offsets:
-            slice_results = all_results[start:end]
-            output[symbol] = self.aggregate(symbol=symbol, results=slice_results)
-
-        return output
-
-
-def _neutral_ticker_sentiment(symbol: str, headlines: list[str]) -> TickerSentiment:
-    return TickerSentiment(
-        symbol=symbol,
-        articles_analyzed=0,
-        avg_positive=0.33,
-        avg_negative=0.33,
-        avg_neutral=0.34,
-        avg_compound=0.0,
-        sentiment_label="neutral",
-        sentiment_score=50.0,
-        top_headlines=headlines[:5],
-        analyzed_at=datetime.utcnow().isoformat(),
-    )
+        # Single pass: stream each result into its symbol's list (no per-symbol slices)
+        per_symbol: dict[str, list[SentimentResult]] = {s: [] for s in symbol_texts}
+        for symbol, result in zip(text_symbols, all_results, strict=True):
+            per_symbol[symbol].append(result)
+
+        now_iso = datetime.utcnow().isoformat()
+        return {
+            symbol: self.aggregate(symbol=symbol, results=results, now_iso=now_iso)
+            for symbol, results in per_symbol.items()
+        }
+
+
+_NEUTRAL_TICKER_TEMPLATE = TickerSentiment(
+    symbol="",
+    articles_analyzed=0,
+    avg_positive=0.33,
+    avg_negative=0.33,
+    avg_neutral=0.34,
+    avg_compound=0.0,
+    sentiment_label="neutral",
+    sentiment_score=50.0,
+    top_headlines=[],
+    analyzed_at="",
+)
+
+
+def _neutral_ticker_sentiment(
+    symbol: str, headlines: list[str], now_iso: str | None = None
+) -> TickerSentiment:
+    # Shallow copy of a validated template; list fields get fresh objects
+    return _NEUTRAL_TICKER_TEMPLATE.model_copy(update={
+        "symbol": symbol,
+        "top_headlines": headlines[:5],
+        "analyzed_at": now_iso or datetime.utcnow().isoformat(),
+        "article_sentiments": [],
+    })
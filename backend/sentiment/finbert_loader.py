@@ -9,18 +9,28 @@ Setup (run once before starting the server):
     python -c "from backend.sentiment.finbert_loader import FinBERTLoader; FinBERTLoader().load(); print('OK')"
 """
 
+import asyncio
 import logging
+from collections import OrderedDict
+from pathlib import Path
 
 import torch
-from transformers import BertForSequenceClassification, BertTokenizer
+from transformers import BertForSequenceClassification, BertTokenizerFast
 
 from backend.config.settings import Settings, get_settings
+from backend.models.sentiment import SentimentResult
 
 logger = logging.getLogger(__name__)
 
 # ProsusAI/finbert label order: index 0=positive, 1=negative, 2=neutral
 LABEL_MAP = {0: "positive", 1: "negative", 2: "neutral"}
 
+_ONNX_FILE_NAME = "model_optimized.onnx"
+
+# Compiled model: pad sequence length to a multiple of this so the dynamic-shape
+# graph sees a handful of lengths instead of every possible one
+_COMPILE_PAD_MULTIPLE = 32
+
 
 class FinBERTLoader:
     """
@@ -31,9 +41,18 @@ class FinBERTLoader:
 
     def __init__(self, settings: Settings | None = None):
         self.settings = settings or get_settings()
-        self.tokenizer: BertTokenizer | None = None
+        self.tokenizer: BertTokenizerFast | None = None
         self.model: BertForSequenceClassification | None = None
         self.device = torch.device(self.settings.FINBERT_DEVICE)
+        # bf16 autocast for the forward pass; resolved in load() (off for int8 weights)
+        self.autocast = False
+        # Passed to the tokenizer as pad_to_multiple_of; set when the model is compiled
+        self.pad_to_multiple_of: int | None = None
+        # CUDA only: flat pinned host buffers per tokenizer output, reused every batch
+        self._pinned: dict[str, torch.Tensor] | None = None
+        # text -> SentimentResult LRU filled by SentimentScorer. Results depend on
+        # the loaded weights/backend/precision, so load() and unload() clear it.
+        self.result_cache: OrderedDict[str, SentimentResult] = OrderedDict()
 
     def load(self) -> None:
         """
@@ -43,26 +62,218 @@ class FinBERTLoader:
         """
         model_name = self.settings.FINBERT_MODEL_NAME
         logger.info("Loading FinBERT model: %s (device=%s)", model_name, self.device)
+        self.result_cache.clear()
 
-        self.tokenizer = BertTokenizer.from_pretrained(model_name)
+        # Rust (HF tokenizers) implementation — tokenization is a large share of
+        # per-batch cost for short headlines
+        self.tokenizer = BertTokenizerFast.from_pretrained(model_name)
+        logger.info(
+            "FinBERT tokenizer: %s (is_fast=%s)", type(self.tokenizer).__name__,
+            self.tokenizer.is_fast,
+        )
+        if self.device.type == "cuda":
+            self._allocate_pinned_buffers()
+        if self.settings.FINBERT_BACKEND.lower() == "onnx" and self._load_onnx(model_name):
+            return
         self.model = BertForSequenceClassification.from_pretrained(model_name)
         self.model.to(self.device)
         self.model.eval()
+        fixed_precision = self._apply_quantization()
+        self.autocast = self.settings.FINBERT_AUTOCAST and not fixed_precision
+        if self.settings.FINBERT_USE_IPEX and not fixed_precision:
+            self._apply_ipex()
+        if self.settings.FINBERT_COMPILE:
+            self._compile()
 
         logger.info("FinBERT loaded successfully — %d parameters", self._param_count())
 
+    async def load_async(self) -> None:
+        """
+        load() in a worker thread, for async startup paths (FastAPI lifespan):
+        download/load/quantize/compile can take 10s+ and must not block the loop.
+        """
+        await asyncio.to_thread(self.load)
+
+    def _load_onnx(self, model_name: str) -> bool:
+        """
+        Load FinBERT as an ONNX Runtime session via optimum. The first run exports
+        the model and applies the transformer graph optimizer (LayerNorm/GeLU/attention
+        fusion, plus FP16 on CUDA), then caches the result under FINBERT_ONNX_CACHE_DIR.
+        The ORT model takes the same torch-tensor kwargs and returns torch logits,
+        so SentimentScorer calls it exactly like the PyTorch model.
+        Returns False (caller falls back to PyTorch) if optimum is missing or export fails.
+        """
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification, ORTOptimizer
+            from optimum.onnxruntime.configuration import OptimizationConfig
+        except ImportError:
+            logger.warning(
+                "FINBERT_BACKEND=onnx but optimum[onnxruntime] is not installed — using PyTorch"
+            )
+            return False
+
+        on_gpu = self.device.type == "cuda"
+        provider = "CUDAExecutionProvider" if on_gpu else "CPUExecutionProvider"
+        cache_dir = (
+            Path(self.settings.FINBERT_ONNX_CACHE_DIR).expanduser()
+            / model_name.replace("/", "--")
+            / ("cuda-fp16" if on_gpu else "cpu")
+        )
+        try:
+            if not (cache_dir / _ONNX_FILE_NAME).exists():
+                logger.info("Exporting FinBERT to ONNX (one-time) → %s", cache_dir)
+                exported = ORTModelForSequenceClassification.from_pretrained(
+                    model_name, export=True
+                )
+                ORTOptimizer.from_pretrained(exported).optimize(
+                    save_dir=cache_dir,
+                    optimization_config=OptimizationConfig(
+                        optimization_level=99, optimize_for_gpu=on_gpu, fp16=on_gpu
+                    ),
+                )
+            self.model = ORTModelForSequenceClassification.from_pretrained(
+                cache_dir, file_name=_ONNX_FILE_NAME, provider=provider
+            )
+        except Exception as e:
+            logger.warning("FinBERT ONNX export/load failed (%s) — using PyTorch", e)
+            self.model = None
+            return False
+
+        self.autocast = False  # precision is baked into the ORT graph
+        logger.info("FinBERT loaded on ONNX Runtime (%s)", provider)
+        return True
+
+    def _apply_quantization(self) -> bool:
+        """
+        Apply FINBERT_QUANTIZATION to the loaded model. Returns True if the weights
+        are now int8 or fp16, which rules out bf16 autocast (dynamic-quantized Linear
+        layers reject bf16 inputs; fp16 weights would just be recast).
+        int8: dynamic quantization of the Linear layers (INT8 GEMM via fbgemm/oneDNN,
+        half the weight bytes). CPU only — other devices keep FP32 weights.
+        fp16: model.half() for tensor cores. CUDA only — input ids stay int64 and
+        SentimentScorer upcasts logits to FP32 before softmax.
+        """
+        mode = self.settings.FINBERT_QUANTIZATION.lower()
+        if mode == "int8":
+            if self.device.type != "cpu":
+                logger.warning(
+                    "FinBERT int8 quantization is CPU-only — keeping fp32 on %s", self.device
+                )
+                return False
+            try:
+                self.model = torch.ao.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                logger.info("FinBERT quantized to int8 (dynamic, Linear layers)")
+                return True
+            except Exception as e:
+                logger.warning("FinBERT int8 quantization failed (%s) — keeping fp32", e)
+        elif mode == "fp16":
+            if self.device.type != "cuda":
+                logger.warning(
+                    "FinBERT fp16 weights are CUDA-only — keeping fp32 on %s", self.device
+                )
+                return False
+            self.model.half()
+            logger.info("FinBERT weights cast to fp16")
+            return True
+        elif mode == "bf16":
+            self.model.to(dtype=torch.bfloat16)
+            logger.info("FinBERT weights cast to bf16")
+        elif mode != "fp32":
+            logger.warning("Unknown FINBERT_QUANTIZATION=%r — keeping fp32", mode)
+        return False
+
+    def _apply_ipex(self) -> None:
+        """
+        ipex.optimize the model for Xeon (fused multi-head attention, oneDNN/AMX
+        kernels), in bf16 when autocast is on. CPU only; no-op if IPEX is missing.
+        The model is not jit-traced: a traced HF model returns tuples instead of
+        ModelOutput and fixes input shapes — use FINBERT_COMPILE for graph capture.
+        """
+        if self.device.type != "cpu":
+            logger.warning("FINBERT_USE_IPEX is CPU-only — skipping on %s", self.device)
+            return
+        try:
+            import intel_extension_for_pytorch as ipex
+        except ImportError:
+            logger.warning("FINBERT_USE_IPEX set but intel_extension_for_pytorch is not installed")
+            return
+        dtype = torch.bfloat16 if self.autocast else torch.float32
+        try:
+            self.model = ipex.optimize(self.model, dtype=dtype, inplace=True)
+            logger.info("FinBERT optimized with IPEX (%s)", dtype)
+        except Exception as e:
+            logger.warning("IPEX optimize failed (%s) — using stock PyTorch kernels", e)
+
+    def _compile(self) -> None:
+        """
+        torch.compile the model (dynamic shapes, reduce-overhead) and run one warmup
+        batch under the same inference_mode/autocast context SentimentScorer uses,
+        so compilation happens here rather than on the first scan.
+        Falls back to the eager model if compilation fails.
+        """
+        eager = self.model
+        try:
+            self.model = torch.compile(eager, mode="reduce-overhead", dynamic=True)
+            self.pad_to_multiple_of = _COMPILE_PAD_MULTIPLE
+            encoded = self.tokenizer(
+                ["warmup"], padding=True, pad_to_multiple_of=self.pad_to_multiple_of,
+                return_tensors="pt",
+            )
+            encoded = self.to_device(encoded)
+            with torch.inference_mode(), torch.autocast(
+                device_type=self.device.type, dtype=torch.bfloat16, enabled=self.autocast
+            ):
+                self.model(**encoded)
+            logger.info("FinBERT compiled with torch.compile")
+        except Exception as e:
+            logger.warning("FinBERT torch.compile failed (%s) — using eager model", e)
+            self.model = eager
+            self.pad_to_multiple_of = None
+
+    def _allocate_pinned_buffers(self) -> None:
+        """One batch_size x max_length pinned int64 buffer per tokenizer output."""
+        size = self.settings.FINBERT_BATCH_SIZE * self.settings.FINBERT_MAX_LENGTH
+        self._pinned = {
+            name: torch.empty(size, dtype=torch.long, pin_memory=True)
+            for name in ("input_ids", "attention_mask", "token_type_ids")
+        }
+
+    def to_device(self, encoded) -> dict[str, torch.Tensor]:
+        """
+        Move tokenizer output to self.device. On CUDA each tensor is staged through
+        its pinned buffer and copied with non_blocking=True, so H2D skips the
+        pageable-memory bounce and overlaps with the queued kernels. Reusing the
+        buffers is safe because the scorer syncs on every batch (.cpu().tolist()).
+        """
+        if self._pinned is None:
+            return {k: v.to(self.device) for k, v in encoded.items()}
+        out = {}
+        for k, v in encoded.items():
+            buf = self._pinned.get(k)
+            if buf is None or v.numel() > buf.numel():
+                out[k] = v.to(self.device)
+                continue
+            staged = buf[: v.numel()].view(v.shape)  # contiguous prefix view
+            staged.copy_(v)
+            out[k] = staged.to(self.device, non_blocking=True)
+        return out
+
     def is_loaded(self) -> bool:
         return self.model is not None and self.tokenizer is not None
 
     def _param_count(self) -> int:
-        if self.model is None:
-            return 0
+        if self.model is None or not hasattr(self.model, "parameters"):
+            return 0  # ONNX Runtime models expose no torch parameters
         return sum(p.numel() for p in self.model.parameters())
 
     def unload(self) -> None:
         """Release model memory (call during shutdown)."""
         self.model = None
         self.tokenizer = None
+        self._pinned = None
+        self.result_cache.clear()
         if self.device.type == "cuda":
             torch.cuda.empty_cache()
         logger.info("FinBERT unloaded")
@@ -8,6 +8,7 @@ import logging
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import numpy as np
 import torch
 import torch.nn.functional as F
 
@@ -16,10 +17,90 @@ from backend.sentiment.finbert_loader import LABEL_MAP, FinBERTLoader
 
 logger = logging.getLogger(__name__)
 
-# Single worker — FinBERT is not thread-safe for concurrent forward passes
+# Single worker — FinBERT is not thread-safe for concurrent forward passes.
+# Concurrency across callers comes from _MicroBatcher coalescing their texts.
 _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="finbert")
 
 
+class _MicroBatcher:
+    """
+    Process-wide request coalescer for one FinBERTLoader.
+    Callers enqueue (texts, future); a background task collects everything that
+    arrives within FINBERT_MICROBATCH_WINDOW_MS (or until FINBERT_BATCH_SIZE texts
+    are pending), runs one _score_batch_sync over the concatenation, and resolves
+    each caller's future with its own slice. Rebinds if the event loop changes.
+    """
+
+    def __init__(self, scorer: "SentimentScorer"):
+        self._scorer = scorer
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+    async def submit(self, texts: list[str]) -> list[SentimentResult]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+        fut = loop.create_future()
+        self._queue.put_nowait((texts, fut))
+        return await fut
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        settings = self._scorer.loader.settings
+        window = settings.FINBERT_MICROBATCH_WINDOW_MS / 1000
+        max_texts = settings.FINBERT_BATCH_SIZE
+        pending: list[tuple[list[str], asyncio.Future]] = []
+
+        try:
+            while True:
+                pending = [await self._queue.get()]
+                n_texts = len(pending[0][0])
+                deadline = loop.time() + window
+                while n_texts < max_texts:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except TimeoutError:
+                        break
+                    pending.append(item)
+                    n_texts += len(item[0])
+
+                all_texts = [t for texts, _ in pending for t in texts]
+                try:
+                    results = await loop.run_in_executor(
+                        _executor, self._scorer._score_batch_sync, all_texts
+                    )
+                except Exception as e:
+                    for _, fut in pending:
+                        if not fut.done():
+                            fut.set_exception(e)
+                    continue
+
+                start = 0
+                for texts, fut in pending:
+                    end = start + len(texts)
+                    if not fut.done():  # caller may have been cancelled
+                        fut.set_result(results[start:end])
+                    start = end
+        finally:
+            # Cancelled (e.g. loop shutdown) mid-batch: never leave a caller awaiting
+            # a future nobody will resolve — in-flight and still-queued alike
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            for _, fut in pending:
+                if not fut.done():
+                    fut.cancel()
+
+
+# One batcher per loader (keyed by id; loaders live for the whole process)
+_batchers: dict[int, _MicroBatcher] = {}
+
+
 class SentimentScorer:
     """
     Async-compatible FinBERT sentiment scorer.
@@ -35,59 +116,116 @@ class SentimentScorer:
     def _score_batch_sync(self, texts: list[str]) -> list[SentimentResult]:
         """
         Synchronous batch inference. Called in thread pool from async code.
-        Processes texts in batches of FINBERT_BATCH_SIZE.
+        Processes texts in batches of FINBERT_BATCH_SIZE, bucketed by token length
+        so each batch pads to its own longest member; results keep input order.
+        Texts already in the result cache (or repeated within the call) are scored once.
         """
         if not self.loader.is_loaded():
             logger.warning("FinBERT not loaded — returning neutral scores")
             return [_neutral_result(t) for t in texts]
 
-        results: list[SentimentResult] = []
+        results: list[SentimentResult | None] = [None] * len(texts)
+        # LRU of scored texts on the loader. Headlines repeat across scans; a hit
+        # skips tokenization and inference. Only touched here, on the single
+        # finbert worker, so no lock is needed.
+        cache = self.loader.result_cache
+        cache_size = self.loader.settings.FINBERT_RESULT_CACHE_SIZE
+
+        # Serve cache hits; group misses by text so duplicates are inferred once
+        misses: dict[str, list[int]] = {}
+        for k, text in enumerate(texts):
+            hit = cache.get(text)
+            if hit is not None:
+                cache.move_to_end(text)
+                results[k] = hit
+            else:
+                misses.setdefault(text, []).append(k)
+        if not misses:
+            return results
+        unique = list(misses)
+
         batch_size = self.loader.settings.FINBERT_BATCH_SIZE
         max_length = self.loader.settings.FINBERT_MAX_LENGTH
-
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
+        device_type = self.loader.device.type
+        autocast = self.loader.autocast
+        pad_to_multiple_of = self.loader.pad_to_multiple_of
+
+        # Tokenize every text in one call (unpadded); the ids give the lengths for
+        # bucketing and each batch is then only padded, never re-tokenized
+        try:
+            tokenized = self.loader.tokenizer(unique, truncation=True, max_length=max_length)
+        except Exception as e:
+            logger.error("FinBERT tokenization error: %s", e)
+            for text, idx in misses.items():
+                neutral = _neutral_result(text)
+                for k in idx:
+                    results[k] = neutral
+            return results
+        features = list(tokenized.keys())
+        # Sort by token length (stable) so batches group similar lengths
+        lengths = [len(ids) for ids in tokenized["input_ids"]]
+        order = np.argsort(lengths, kind="stable").tolist()
+
+        for i in range(0, len(unique), batch_size):
+            batch_idx = order[i : i + batch_size]
+            batch = [unique[u] for u in batch_idx]
             try:
-                encoded = self.loader.tokenizer(
-                    batch,
+                encoded = self.loader.tokenizer.pad(
+                    {f: [tokenized[f][u] for u in batch_idx] for f in features},
                     padding=True,
-                    truncation=True,
-                    max_length=max_length,
+                    pad_to_multiple_of=pad_to_multiple_of,
                     return_tensors="pt",
                 )
-                encoded = {k: v.to(self.loader.device) for k, v in encoded.items()}
+                encoded = self.loader.to_device(encoded)
 
-                with torch.no_grad():
+                with torch.inference_mode(), torch.autocast(
+                    device_type=device_type, dtype=torch.bfloat16, enabled=autocast
+                ):
                     outputs = self.loader.model(**encoded)
-                    probs = F.softmax(outputs.logits, dim=-1)
+                    # FP32 probability math — logits are bf16 under autocast
+                    logits = outputs.logits.float()
+                    # argmax(logits) == argmax(softmax); one host transfer per batch
+                    labels = logits.argmax(dim=-1).tolist()
+                    probs = F.softmax(logits, dim=-1).cpu().tolist()
 
-                for j, text in enumerate(batch):
-                    p = probs[j].tolist()
-                    pos, neg, neu = p[0], p[1], p[2]
+                for text, (pos, neg, neu), label_idx in zip(batch, probs, labels, strict=True):
                     compound = round(pos - neg, 4)
-                    label = LABEL_MAP[int(torch.argmax(probs[j]).item())]
-                    results.append(
-                        SentimentResult(
-                            text=text[:200],
-                            positive=round(pos, 4),
-                            negative=round(neg, 4),
-                            neutral=round(neu, 4),
-                            compound_score=compound,
-                            label=label,
-                        )
+                    label = LABEL_MAP[label_idx]
+                    result = SentimentResult(
+                        text=text[:200],
+                        positive=round(pos, 4),
+                        negative=round(neg, 4),
+                        neutral=round(neu, 4),
+                        compound_score=compound,
+                        label=label,
                     )
+                    for k in misses[text]:
+                        results[k] = result
+                    cache[text] = result
             except Exception as e:
+                # Fallbacks are not cached — the next call retries inference
                 logger.error("FinBERT batch inference error: %s", e)
-                results.extend([_neutral_result(t) for t in batch])
+                for text in batch:
+                    neutral = _neutral_result(text)
+                    for k in misses[text]:
+                        results[k] = neutral
+
+        while len(cache) > cache_size:
+            cache.popitem(last=False)
 
         return results
 
     async def score_texts_async(self, texts: list[str]) -> list[SentimentResult]:
-        """Async wrapper: runs FinBERT in thread pool, returns SentimentResult list."""
+        """
+        Async wrapper: queues texts on the loader's micro-batcher, which runs FinBERT
+        in the thread pool (shared with concurrent callers), returns SentimentResult list.
+        """
         if not texts:
             return []
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(_executor, self._score_batch_sync, texts)
+        batcher = _batchers.get(id(self.loader))
+        if batcher is None:
+            batcher = _batchers[id(self.loader)] = _MicroBatcher(self)
+        return await batcher.submit(texts)
 
     async def score_single_async(self, text: str) -> SentimentResult:
         """Convenience method for scoring a single text."""
@@ -95,12 +233,16 @@ class SentimentScorer:
         return results[0] if results else _neutral_result(text)
 
 
+_NEUTRAL_TEMPLATE = SentimentResult(
+    text="",
+    positive=0.33,
+    negative=0.33,
+    neutral=0.34,
+    compound_score=0.0,
+    label="neutral",
+)
+
+
 def _neutral_result(text: str) -> SentimentResult:
-    return SentimentResult(
-        text=text[:200],
-        positive=0.33,
-        negative=0.33,
-        neutral=0.34,
-        compound_score=0.0,
-        label="neutral",
-    )
+    # Shallow copy of a validated template — every other field is immutable
+    return _NEUTRAL_TEMPLATE.model_copy(update={"text": text[:200]})
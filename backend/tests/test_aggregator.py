@@ -0,0 +1,101 @@
+"""Unit tests for per-ticker sentiment aggregation."""
+
+import random
+
+from backend.models.sentiment import ArticleSentiment, NewsArticle, SentimentResult, TickerSentiment
+from backend.sentiment.aggregator import SentimentAggregator
+
+aggregator = SentimentAggregator()
+
+
+def _loop_aggregate(
+    symbol: str, results: list[SentimentResult], articles: list[NewsArticle] | None,
+    headlines: list[str] | None,
+) -> TickerSentiment:
+    """The pre-NumPy aggregate: three sum() passes and round() per article field."""
+    n = len(results)
+    avg_pos = sum(r.positive for r in results) / n
+    avg_neg = sum(r.negative for r in results) / n
+    avg_neu = sum(r.neutral for r in results) / n
+    avg_compound = avg_pos - avg_neg
+    scores = {"positive": avg_pos, "negative": avg_neg, "neutral": avg_neu}
+    article_sentiments = []
+    for i, result in enumerate(results):
+        art = articles[i] if articles and i < len(articles) else None
+        article_sentiments.append(ArticleSentiment(
+            headline=art.title if art else result.text[:100],
+            url=art.url if art else "",
+            published_at=art.published_at if art else "",
+            source=art.source if art else "",
+            positive=round(result.positive, 4),
+            negative=round(result.negative, 4),
+            neutral=round(result.neutral, 4),
+            label=result.label,
+        ))
+    return TickerSentiment(
+        symbol=symbol,
+        articles_analyzed=n,
+        avg_positive=round(avg_pos, 4),
+        avg_negative=round(avg_neg, 4),
+        avg_neutral=round(avg_neu, 4),
+        avg_compound=round(avg_compound, 4),
+        sentiment_label=max(scores, key=lambda k: scores[k]),
+        sentiment_score=round(((avg_compound + 1) / 2) * 100, 2),
+        top_headlines=(headlines or [])[:5],
+        analyzed_at="",
+        article_sentiments=article_sentiments,
+    )
+
+
+def _make_result(i: int, pos: float, neg: float, neu: float) -> SentimentResult:
+    probs = {"positive": pos, "negative": neg, "neutral": neu}
+    return SentimentResult(
+        text=f"headline {i} " * 12, positive=pos, negative=neg, neutral=neu,
+        compound_score=round(pos - neg, 4), label=max(probs, key=probs.get),
+    )
+
+
+def _random_results(rng: random.Random, n: int, decimals: int | None) -> list[SentimentResult]:
+    results = []
+    for i in range(n):
+        a, b = sorted((rng.random(), rng.random()))
+        pos, neg, neu = a, b - a, 1 - b
+        if decimals is not None:  # SentimentScorer rounds its probabilities to 4 places
+            pos, neg, neu = round(pos, decimals), round(neg, decimals), round(neu, decimals)
+        results.append(_make_result(i, pos, neg, neu))
+    return results
+
+
+def _assert_matches_loop(results, articles=None, headlines=None):
+    got = aggregator.aggregate("TEST", results, articles, headlines, now_iso="")
+    assert got == _loop_aggregate("TEST", results, articles, headlines)
+
+
+def test_aggregate_matches_loop_formula():
+    """The vectorized mean/round should reproduce the per-field Python loop exactly."""
+    rng = random.Random(0)
+    for trial in range(2000):
+        n = rng.randint(1, 40)
+        results = _random_results(rng, n, decimals=4 if trial % 2 else None)
+        articles = [
+            NewsArticle(title=f"title {i}", url=f"https://x/{i}", source="wire")
+            for i in range(rng.randint(0, n))
+        ]
+        _assert_matches_loop(results, articles or None, [a.title for a in articles])
+
+
+def test_aggregate_ties_pick_first_label():
+    """Tied averages resolve to the first of positive/negative/neutral, as max() did."""
+    _assert_matches_loop([_make_result(0, 0.4, 0.4, 0.2)])
+    _assert_matches_loop([_make_result(0, 0.2, 0.4, 0.4), _make_result(1, 0.2, 0.4, 0.4)])
+    _assert_matches_loop([_make_result(0, 0.5, 0.0, 0.5), _make_result(1, 0.0, 0.5, 0.5)])
+
+
+def test_aggregate_empty_is_neutral():
+    """No results should give the neutral template with the caller's headlines."""
+    got = aggregator.aggregate("TEST", [], headlines=list("abcdefg"), now_iso="t")
+    assert got.sentiment_label == "neutral"
+    assert got.sentiment_score == 50.0
+    assert got.top_headlines == list("abcde")
+    assert got.analyzed_at == "t"
+    assert got.article_sentiments == []
@@ -0,0 +1,115 @@
+"""Unit tests for the Redis cache serialization and fallback paths."""
+
+from datetime import date
+
+from backend.api.cache import RedisCache
+from backend.models.fundamentals import FundamentalData
+
+
+def _make_fund(score: float) -> FundamentalData:
+    return FundamentalData(
+        symbol="TEST", fundamental_score=score, next_earnings_date=date(2026, 11, 5)
+    )
+
+
+async def test_cached_models_keep_raw_scores():
+    """A cache hit should carry the same unrounded score for single models and lists."""
+    cache = RedisCache(None)  # every Redis call fails → local fallback
+    fund = _make_fund(61.23456)
+    await cache.set("single", fund, ttl=60)
+    await cache.set("many", [fund, fund], ttl=60)
+
+    single = FundamentalData.model_validate(await cache.get("single"))
+    many = [FundamentalData.model_validate(v) for v in await cache.get("many")]
+    assert single == fund
+    assert many == [fund, fund]
+    # JSON responses still round at the API boundary
+    assert '"fundamental_score":61.23' in fund.model_dump_json()
+
+
+class _FakeRedis:
+    """In-memory stand-in for redis.asyncio.Redis; records round-trips."""
+
+    def __init__(self):
+        self.store: dict[str, str | bytes] = {}
+        self.ttls: dict[str, int] = {}
+        self.calls: list[str] = []
+
+    async def get(self, key):
+        self.calls.append("get")
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.calls.append("setex")
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+    async def mget(self, keys):
+        self.calls.append("mget")
+        return [self.store.get(k) for k in keys]
+
+    def pipeline(self, transaction=True):
+        self.calls.append(f"pipeline(transaction={transaction})")
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis):
+        self._redis = redis
+        self._queued: list[tuple[str, int, str | bytes]] = []
+
+    def setex(self, key, ttl, value):
+        self._queued.append((key, ttl, value))
+
+    async def execute(self):
+        self._redis.calls.append("execute")
+        for key, ttl, value in self._queued:
+            self._redis.store[key] = value
+            self._redis.ttls[key] = ttl
+
+
+async def test_mget_matches_get_per_key():
+    """MGET should return, in key order, exactly what one get() per key returns."""
+    for cache in (RedisCache(_FakeRedis()), RedisCache(None)):
+        await cache.set("a", {"x": 1}, ttl=60)
+        await cache.set("c", [1.5, "two"], ttl=60)
+        keys = ["a", "b", "c", "a"]
+        assert await cache.mget(keys) == [await cache.get(k) for k in keys]
+        assert await cache.mget(keys) == [{"x": 1}, None, [1.5, "two"], {"x": 1}]
+
+
+async def test_mget_is_one_round_trip():
+    """A batch lookup is a single MGET; an empty one never reaches Redis."""
+    redis = _FakeRedis()
+    cache = RedisCache(redis)
+    assert await cache.mget([]) == []
+    await cache.mget(["a", "b", "c"])
+    assert redis.calls == ["mget"]
+
+
+async def test_pipeline_set_matches_set_per_item():
+    """pipeline_set should store exactly what one set() per item stores, TTLs included."""
+    items = [("fund", _make_fund(61.23456), 3600), ("iv", 42.5, 300), ("news", {"n": [1, 2]}, 60)]
+
+    piped, single = _FakeRedis(), _FakeRedis()
+    await RedisCache(piped).pipeline_set(items)
+    for key, value, ttl in items:
+        await RedisCache(single).set(key, value, ttl)
+    assert piped.store == single.store
+    assert piped.ttls == single.ttls
+
+    fallback = RedisCache(None)
+    await fallback.pipeline_set(items)
+    assert await fallback.mget([k for k, _, _ in items]) == await RedisCache(single).mget(
+        [k for k, _, _ in items]
+    )
+
+
+async def test_pipeline_set_is_one_round_trip():
+    """All writes go through one non-transactional pipeline; no items means no Redis call."""
+    redis = _FakeRedis()
+    cache = RedisCache(redis)
+    await cache.pipeline_set([])
+    assert redis.calls == []
+    await cache.pipeline_set([("a", 1, 60), ("b", 2, 60), ("c", 3, 60)])
+    assert redis.calls == ["pipeline(transaction=False)", "execute"]
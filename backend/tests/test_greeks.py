@@ -1,8 +1,15 @@
 """Unit tests for the Black-Scholes greeks calculator."""
 
 import math
+
+import numpy as np
 import pytest
-from backend.scanner.greeks_calculator import compute_greeks, compute_probability_of_profit
+from backend.scanner.greeks_calculator import (
+    compute_greeks,
+    compute_greeks_batch,
+    compute_probability_of_profit,
+    compute_probability_of_profit_batch,
+)
 
 
 def test_call_delta_atm():
@@ -60,3 +67,31 @@ def test_pop_otm_spread():
     """Breakeven above spot → PoP < 0.5 for a bull spread."""
     pop = compute_probability_of_profit(breakeven=110, spot=100, iv=0.20, dte=30)
     assert pop < 0.5
+
+
+def test_pop_batch_matches_scalar():
+    """Batched PoP should match the scalar function element-wise, including invalid rows."""
+    breakeven = np.array([105.0, 110.0, 95.0, 100.0, 0.0])
+    spot = np.array([100.0, 100.0, 100.0, 100.0, 100.0])
+    iv = np.array([0.25, 0.20, 0.30, 0.0, 0.25])
+    dte = np.array([30, 30, 400, 30, 0])
+    batch = compute_probability_of_profit_batch(breakeven, spot, iv, dte)
+    for i in range(len(batch)):
+        expected = compute_probability_of_profit(
+            breakeven=breakeven[i], spot=spot[i], iv=iv[i], dte=int(dte[i])
+        )
+        assert batch[i] == pytest.approx(expected, abs=1e-4)
+
+
+def test_greeks_batch_matches_scalar():
+    """Batched greeks should match the scalar function per strike, zeros on invalid rows."""
+    strikes = np.array([80.0, 100.0, 120.0, 100.0, 0.0, 100.0])
+    ivs = np.array([0.25, 0.20, 0.35, 0.0, 0.30, np.nan])
+    for option_type in ["call", "put"]:
+        batch = compute_greeks_batch(100.0, strikes, 0.5, 0.05, ivs, option_type)
+        for i in range(len(strikes)):
+            scalar = compute_greeks(
+                S=100.0, K=strikes[i], T=0.5, r=0.05, sigma=ivs[i], option_type=option_type
+            )
+            for name, value in scalar.items():
+                assert batch[name][i] == pytest.approx(value, abs=1e-9, nan_ok=True)
@@ -0,0 +1,100 @@
+"""Unit tests for the SpreadRanker matrix inference path."""
+
+import random
+
+import numpy as np
+import pytest
+from backend.ml.features import FEATURE_NAMES, N_FEATURES
+from backend.ml.model import SpreadRanker
+from backend.models.ml import FeatureVector, MLPrediction
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from xgboost import XGBRegressor
+
+
+def _make_matrix(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, N_FEATURES))
+    col = FEATURE_NAMES.index
+    X[:, col("iv_rank")] = rng.uniform(0, 100, n)
+    X[:, col("dte")] = rng.uniform(0, 720, n)  # includes dte < 1
+    X[:, col("max_risk_reward_ratio")] = rng.uniform(0, 4, n)
+    X[:, col("fundamental_score")] = rng.uniform(0, 100, n)
+    X[:, col("sentiment_score")] = rng.uniform(0, 100, n)
+    return X
+
+
+def _make_ranker(placeholder: bool = False) -> SpreadRanker:
+    ranker = SpreadRanker(model_path="unused", scaler_path="unused")
+    if not placeholder:
+        X = _make_matrix(200, seed=1)
+        y = X[:, FEATURE_NAMES.index("fundamental_score")] * 0.8 + X[:, 0] * 10
+        ranker.pipeline = Pipeline([
+            ("scaler", StandardScaler()),
+            ("xgb", XGBRegressor(n_estimators=10, max_depth=3, verbosity=0)),
+        ]).fit(X, y)
+        ranker._is_placeholder = False
+    return ranker
+
+
+def _per_row_prediction(ranker: SpreadRanker, fv: FeatureVector) -> MLPrediction:
+    """The pre-matrix path: one pipeline.predict per FeatureVector, fields read off the model."""
+    if ranker._is_placeholder:
+        base = 40.0 + fv.fundamental_score * 0.2 + fv.sentiment_score * 0.1
+        score = max(20.0, min(80.0, base + random.uniform(-5, 5)))
+        return MLPrediction(
+            spread_quality_score=round(score, 2),
+            expected_return_pct=round(fv.max_risk_reward_ratio * 30, 2),
+            probability_of_profit=max(0.3, min(0.75, fv.iv_rank / 100 * 0.5 + 0.3)),
+            confidence=0.3,
+            feature_importances={},
+            is_placeholder=True,
+        )
+    x = np.array([[getattr(fv, name) for name in FEATURE_NAMES]], dtype=float)
+    score = ranker.pipeline.predict(x)[0]
+    return MLPrediction(
+        spread_quality_score=float(np.clip(score, 0, 100)),
+        expected_return_pct=ranker._estimate_return(fv.dte, fv.max_risk_reward_ratio, score),
+        probability_of_profit=float(fv.iv_rank / 100),
+        confidence=ranker._compute_confidence(score),
+        feature_importances=ranker._get_importances(),
+        is_placeholder=False,
+    )
+
+
+def _to_feature_vectors(X: np.ndarray) -> list[FeatureVector]:
+    return [FeatureVector(**dict(zip(FEATURE_NAMES, row, strict=True))) for row in X.tolist()]
+
+
+def test_predict_matrix_matches_per_row_predict():
+    """Whole-matrix inplace_predict should give the same predictions as per-row pipeline.predict."""
+    ranker = _make_ranker()
+    X = _make_matrix(50)
+    batch = ranker.predict_matrix(X)
+    expected = [_per_row_prediction(ranker, fv) for fv in _to_feature_vectors(X)]
+    assert len(batch) == len(expected)
+    for got, want in zip(batch, expected, strict=True):
+        assert got.spread_quality_score == pytest.approx(want.spread_quality_score, abs=1e-4)
+        assert got.model_dump(exclude={"spread_quality_score"}) == want.model_dump(
+            exclude={"spread_quality_score"}
+        )
+        assert not got.is_placeholder
+
+
+def test_predict_matrix_placeholder_matches_per_row():
+    """Placeholder mode should draw the same noise, in order, as the per-FeatureVector path."""
+    ranker = _make_ranker(placeholder=True)
+    X = _make_matrix(20)
+    random.seed(7)
+    batch = ranker.predict_matrix(X)
+    random.seed(7)
+    expected = [_per_row_prediction(ranker, fv) for fv in _to_feature_vectors(X)]
+    assert batch == expected
+
+
+def test_predict_from_features_matches_predict_matrix():
+    """FeatureVectors are stacked in FEATURE_NAMES order and scored like the matrix."""
+    ranker = _make_ranker()
+    X = _make_matrix(10)
+    assert ranker.predict_from_features(_to_feature_vectors(X)) == ranker.predict_matrix(X)
+    assert ranker.predict_from_features([]) == ranker.predict_matrix(X[:0]) == []
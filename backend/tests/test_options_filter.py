@@ -0,0 +1,36 @@
+"""Unit tests for the options leg filter."""
+
+from datetime import date, timedelta
+
+from backend.models.options import OptionQuote, OptionType, SpreadType
+from backend.models.scanner import ScannerFilters
+from backend.scanner.options_filter import OptionsFilter
+
+options_filter = OptionsFilter()
+
+
+def _make_quote(dte: int, bid: float, ask: float, volume: int = 500, oi: int = 1000) -> OptionQuote:
+    return OptionQuote(
+        symbol="TEST_C", underlying="TEST", expiration=date.today() + timedelta(days=dte),
+        strike=100.0, option_type=OptionType.CALL, bid=bid, ask=ask, mid=(bid + ask) / 2,
+        last=ask, volume=volume, open_interest=oi, implied_volatility=0.3,
+        delta=0.5, gamma=0.0, theta=0.0, vega=0.0, rho=0.0,
+    )
+
+
+QUOTES = [
+    _make_quote(45, 1.00, 1.10),
+    _make_quote(10, 1.00, 1.10),             # DTE too short
+    _make_quote(45, 1.00, 1.10, volume=5),   # illiquid volume
+    _make_quote(45, 1.00, 1.10, oi=10),      # illiquid OI
+    _make_quote(45, 0.00, 1.10),             # no bid
+    _make_quote(45, 1.00, 3.00),             # wide market
+    _make_quote(300, 5.00, 5.20),            # LEAPS-dated
+]
+
+
+def test_filter_legs_spread_strategy():
+    """Only the first quote passes every check for a short-dated spread."""
+    kept = options_filter.filter_legs(QUOTES, ScannerFilters(), SpreadType.BULL_CALL)
+    assert kept == [QUOTES[0]]
+
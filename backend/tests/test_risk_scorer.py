@@ -0,0 +1,66 @@
+"""Unit tests for the composite risk scorer."""
+
+from datetime import date, timedelta
+
+import pytest
+from backend.models.fundamentals import FundamentalData
+from backend.models.options import OptionQuote, OptionType, SpreadCandidate, SpreadType
+from backend.models.sentiment import TickerSentiment
+from backend.scanner.risk_scorer import RiskScorer
+from backend.scanner.scan_frame import ScanFrame
+
+scorer = RiskScorer()
+EXPIRY = date.today() + timedelta(days=45)
+
+
+def _make_candidate(iv_rank: float, ba_quality: float, oi: int, volume: int) -> SpreadCandidate:
+    leg = OptionQuote(
+        symbol="TEST100C", underlying="TEST", expiration=EXPIRY, strike=100.0,
+        option_type=OptionType.CALL, bid=2.0, ask=2.1, mid=2.05, last=2.0,
+        volume=volume, open_interest=oi, implied_volatility=0.3,
+        delta=0.5, gamma=0.0, theta=0.0, vega=0.0, rho=0.0,
+    )
+    return SpreadCandidate(
+        underlying="TEST", spread_type=SpreadType.BULL_CALL, expiration=EXPIRY, dte=45,
+        long_leg=leg, net_debit=2.0, max_profit=3.0, max_loss=2.0, breakeven=102.0,
+        probability_of_profit=0.45, bid_ask_quality_score=ba_quality, iv_rank=iv_rank,
+    )
+
+
+def _make_sentiment(score: float) -> TickerSentiment:
+    return TickerSentiment(
+        symbol="TEST", articles_analyzed=0, avg_positive=0.0, avg_negative=0.0,
+        avg_neutral=1.0, avg_compound=0.0, sentiment_label="neutral",
+        sentiment_score=score, top_headlines=[], analyzed_at="",
+    )
+
+
+def test_score_batch_matches_scalar():
+    """Frame scoring should match per-candidate score(), including the missing/zero fund fallback."""
+    rows = [
+        # iv_rank, ba_quality, oi, volume, fundamental_score, sentiment_score
+        (35.0, 0.82, 1500, 800, 72.345, 61.0),
+        (120.0, -0.1, 333, 77, None, 50.0),
+        (0.0, 1.4, 0, 0, 0.0, 12.5),
+        (64.2, 0.5, 999, 499, 41.7, 88.8),
+        (12.5, 0.333, 20, 1234, 0.004, 50.0),
+    ]
+    candidates = [_make_candidate(iv, ba, oi, vol) for iv, ba, oi, vol, _, _ in rows]
+    funds = [FundamentalData(symbol="TEST", fundamental_score=f) for *_, f, _ in rows]
+    sents = [_make_sentiment(s) for *_, s in rows]
+
+    batch = scorer.score_batch(ScanFrame.from_candidates(candidates, funds, sents))
+    assert len(batch) == len(rows)
+    for got, cand, fund, sent in zip(batch, candidates, funds, sents, strict=True):
+        expected = scorer.score(cand, fund, sent)
+        for field in (
+            "composite_score", "iv_rank_component", "bid_ask_component",
+            "fundamental_component", "sentiment_component", "liquidity_component",
+        ):
+            assert getattr(got, field) == pytest.approx(getattr(expected, field), abs=1e-9)
+        assert got.breakdown == pytest.approx(expected.breakdown, abs=1e-9)
+
+
+def test_score_batch_empty_frame():
+    """An empty frame should produce no scores."""
+    assert scorer.score_batch(ScanFrame.from_candidates([], [], [])) == []
@@ -0,0 +1,216 @@
+"""Unit tests for the scanner's fundamentals/sentiment stages (fake clients, no network)."""
+
+import asyncio
+
+import pytest
+from backend.api.cache import RedisCache
+from backend.config.settings import Settings
+from backend.models.fundamentals import FundamentalData
+from backend.models.sentiment import NewsArticle, SentimentResult, TickerSentiment
+from backend.scanner import scanner as scanner_module
+from backend.scanner.scanner import OptionsScanner, _neutral_sentiment
+from backend.sentiment.aggregator import SentimentAggregator
+
+ARTICLES = {
+    "AAA": [NewsArticle(title=f"AAA beats estimates {i}", description="strong quarter") for i in range(3)],
+    "BBB": [NewsArticle(title=f"BBB cuts guidance {i}") for i in range(3)],
+    "CCC": [NewsArticle(title="CCC launches product"), NewsArticle(title=""),
+            NewsArticle(title="CCC shares rise", description="on volume")],
+    "DDD": [NewsArticle(title="")],  # nothing to score
+}
+
+
+class _FakeFMP:
+    def __init__(self):
+        self.requested: list[str] = []
+
+    async def get_full_fundamentals(self, symbol: str) -> FundamentalData:
+        self.requested.append(symbol)
+        if symbol == "ERR":
+            raise RuntimeError("FMP down")
+        if symbol == "EMPTY":
+            return FundamentalData(symbol=symbol)  # 429-style empty payload
+        return FundamentalData(
+            symbol=symbol, company_name=f"{symbol} Inc", pe_ratio=10.0 + len(symbol),
+            revenue_growth_yoy=0.12, debt_to_equity=0.8, gross_margin=0.45,
+        )
+
+
+class _FakeNews:
+    def __init__(self, gate: asyncio.Event | None = None):
+        self.gate = gate
+        self.started = asyncio.Event()
+        self.cancelled: list[str] = []
+
+    async def get_news(self, symbol: str) -> list[NewsArticle]:
+        self.started.set()
+        if self.gate is not None:
+            try:
+                await self.gate.wait()
+            except asyncio.CancelledError:
+                self.cancelled.append(symbol)
+                raise
+        if symbol not in ARTICLES:
+            raise RuntimeError("news down")
+        return ARTICLES[symbol]
+
+
+class _FakeScorer:
+    """Deterministic per-text scores; records each call's size and can fail chosen calls."""
+
+    def __init__(self, fail_calls: tuple[int, ...] = ()):
+        self.fail_calls = fail_calls
+        self.calls: list[int] = []
+
+    async def score_texts_async(self, texts: list[str]) -> list[SentimentResult]:
+        self.calls.append(len(texts))
+        if len(self.calls) - 1 in self.fail_calls:
+            raise RuntimeError("FinBERT failed")
+        results = []
+        for text in texts:
+            pos, neg = (len(text) % 7) / 10, (len(text) % 3) / 10
+            probs = {"positive": pos, "negative": neg, "neutral": round(1 - pos - neg, 4)}
+            results.append(SentimentResult(
+                text=text[:200], positive=pos, negative=neg, neutral=probs["neutral"],
+                compound_score=round(pos - neg, 4), label=max(probs, key=probs.get),
+            ))
+        return results
+
+
+async def _per_symbol_sentiment(scanner: OptionsScanner, symbol: str) -> TickerSentiment:
+    """The pre-batching path: fetch, score and aggregate one symbol on its own."""
+    articles = await scanner.news.get_news(symbol)
+    texts = [(a.title + " " + (a.description or "")).strip() for a in articles if a.title]
+    if not texts:
+        return _neutral_sentiment(symbol)
+    return scanner.sentiment_aggregator.aggregate(
+        symbol=symbol,
+        results=await scanner.sentiment_scorer.score_texts_async(texts),
+        articles=[a for a in articles if a.title],
+        headlines=[a.title for a in articles[:5]],
+    )
+
+
+def _comparable(sentiment: TickerSentiment) -> dict:
+    return sentiment.model_dump(exclude={"analyzed_at"})
+
+
+@pytest.fixture
+def make_scanner(monkeypatch):
+    """Build an OptionsScanner on fakes; OutcomeLogger is stubbed so no DB file is created."""
+    monkeypatch.setattr(scanner_module, "OutcomeLogger", lambda: None)
+
+    def build(cache: RedisCache | None = None, **fakes) -> OptionsScanner:
+        return OptionsScanner(
+            yf_client=None,
+            fmp_client=fakes.get("fmp") or _FakeFMP(),
+            news_aggregator=fakes.get("news"),
+            sentiment_scorer=fakes.get("scorer"),
+            sentiment_aggregator=SentimentAggregator(),
+            ml_ranker=None,
+            cache=cache or RedisCache(None),
+            settings=Settings(),
+        )
+
+    return build
+
+
+async def test_fetch_fundamentals_serves_hits_and_fetches_misses(make_scanner):
+    """Cached symbols skip FMP; results match per-symbol scoring and keep input order."""
+    fmp = _FakeFMP()
+    scanner = make_scanner(fmp=fmp)
+    cached = scanner.fundamentals_scorer.score(await _FakeFMP().get_full_fundamentals("AAA"))
+    await scanner.cache.set("fundamentals:AAA", cached, ttl=60)
+
+    symbols = ["BBB", "AAA", "ERR", "EMPTY"]
+    result = await scanner._fetch_fundamentals(symbols)
+
+    assert list(result) == symbols
+    assert fmp.requested == ["BBB", "ERR", "EMPTY"]
+    assert result["AAA"].model_dump() == cached.model_dump()
+    expected = scanner.fundamentals_scorer.score(await _FakeFMP().get_full_fundamentals("BBB"))
+    assert result["BBB"] == expected
+    assert result["ERR"] == FundamentalData(symbol="ERR")
+    # Only real payloads are cached
+    assert [await scanner.cache.get(f"fundamentals:{s}") is not None for s in symbols] == [
+        True, True, False, False,
+    ]
+
+
+async def test_enrich_from_queue_matches_direct_fetch(make_scanner):
+    """Queued symbols are enriched once each, with the same results as fetching them directly."""
+    fmp = _FakeFMP()
+    scanner = make_scanner(fmp=fmp, news=_FakeNews(), scorer=_FakeScorer())
+    queue: asyncio.Queue = asyncio.Queue()
+    consumer = asyncio.create_task(scanner._enrich_from_queue(queue))
+    for item in [("AAA", ["spread"]), ("BBB", []), ("CCC", ["spread"])]:
+        queue.put_nowait(item)
+        await asyncio.sleep(0)  # separate micro-batches
+    queue.put_nowait(("AAA", ["spread"]))  # already enriched
+    queue.put_nowait(("DDD", ["spread"]))
+    queue.put_nowait(None)
+    fundamentals, sentiments = await consumer
+
+    symbols = ["AAA", "CCC", "DDD"]  # BBB arrived without candidates
+    assert set(fundamentals) == set(sentiments) == set(symbols)
+    assert sorted(fmp.requested) == symbols
+
+    reference = make_scanner(news=_FakeNews(), scorer=_FakeScorer())
+    expected = await reference._fetch_fundamentals(symbols)
+    for symbol in symbols:
+        assert fundamentals[symbol] == expected[symbol]
+        assert _comparable(sentiments[symbol]) == _comparable(
+            await _per_symbol_sentiment(reference, symbol)
+        )
+
+
+async def test_enrich_from_queue_cancels_inflight_fetches(make_scanner):
+    """Cancelling the consumer cancels the fetches it already started."""
+    news = _FakeNews(gate=asyncio.Event())
+    scanner = make_scanner(news=news, scorer=_FakeScorer())
+    queue: asyncio.Queue = asyncio.Queue()
+    consumer = asyncio.create_task(scanner._enrich_from_queue(queue))
+    queue.put_nowait(("AAA", ["spread"]))
+    await asyncio.wait_for(news.started.wait(), 1)
+
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+    for _ in range(3):
+        await asyncio.sleep(0)  # let the child task observe its cancellation
+    assert news.cancelled == ["AAA"]
+
+
+async def test_fetch_sentiment_chunks_match_per_symbol_path(make_scanner, monkeypatch):
+    """Texts from all symbols are scored in bounded chunks; each symbol matches scoring it alone."""
+    monkeypatch.setattr(scanner_module, "SENTIMENT_MAX_BATCH", 4)
+    scorer = _FakeScorer()
+    scanner = make_scanner(news=_FakeNews(), scorer=scorer)
+    symbols = ["AAA", "BBB", "CCC", "DDD", "NEWSERR"]
+    result = await scanner._fetch_sentiment(symbols)
+
+    assert list(result) == symbols
+    assert scorer.calls == [4, 4]  # 3 + 3 + 2 texts, split across symbol boundaries
+    reference = make_scanner(news=_FakeNews(), scorer=_FakeScorer())
+    for symbol in ["AAA", "BBB", "CCC", "DDD"]:
+        expected = _comparable(await _per_symbol_sentiment(reference, symbol))
+        assert _comparable(result[symbol]) == expected
+        assert _comparable(TickerSentiment(**await scanner.cache.get(f"sentiment_v2:{symbol}"))) == expected
+    # A news failure goes neutral and is not cached, so the next scan retries it
+    assert _comparable(result["NEWSERR"]) == _comparable(_neutral_sentiment("NEWSERR"))
+    assert await scanner.cache.get("sentiment_v2:NEWSERR") is None
+
+
+async def test_fetch_sentiment_failed_chunk_goes_neutral(make_scanner, monkeypatch):
+    """Only symbols with a text in a failed chunk fall back to neutral (uncached)."""
+    monkeypatch.setattr(scanner_module, "SENTIMENT_MAX_BATCH", 4)
+    scanner = make_scanner(news=_FakeNews(), scorer=_FakeScorer(fail_calls=(1,)))
+    result = await scanner._fetch_sentiment(["AAA", "BBB", "CCC"])
+
+    reference = make_scanner(news=_FakeNews(), scorer=_FakeScorer())
+    assert _comparable(result["AAA"]) == _comparable(await _per_symbol_sentiment(reference, "AAA"))
+    assert await scanner.cache.get("sentiment_v2:AAA") is not None
+    # Texts 4-7 (BBB's last two, CCC's two) were in the failed second chunk
+    for symbol in ["BBB", "CCC"]:
+        assert _comparable(result[symbol]) == _comparable(_neutral_sentiment(symbol))
+        assert await scanner.cache.get(f"sentiment_v2:{symbol}") is None
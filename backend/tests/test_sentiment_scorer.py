@@ -0,0 +1,178 @@
+"""Unit tests for the FinBERT sentiment scorer (fake tokenizer and model, no weights)."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+import torch
+from backend.config.settings import Settings
+from backend.sentiment.finbert_loader import FinBERTLoader
+from backend.sentiment.sentiment_scorer import SentimentScorer, _batchers
+
+
+class _FakeTokenizer:
+    """One id per word (its length + 1), plus a trailing 1 so empty texts have a token."""
+
+    def __call__(self, texts, truncation=True, max_length=512):
+        ids = [([len(w) + 1 for w in t.split()] + [1])[:max_length] for t in texts]
+        return {"input_ids": ids, "attention_mask": [[1] * len(x) for x in ids]}
+
+    def pad(self, features, padding=True, pad_to_multiple_of=None, return_tensors="pt"):
+        width = max(len(x) for x in features["input_ids"])
+        return {
+            name: torch.tensor([row + [0] * (width - len(row)) for row in rows])
+            for name, rows in features.items()
+        }
+
+
+class _FakeModel:
+    """Logits depend only on a text's own (unpadded) ids; records each forward's texts."""
+
+    def __init__(self):
+        self.batches: list[list[list[int]]] = []
+        self.widths: list[int] = []  # padded length of each forward
+
+    def __call__(self, input_ids, attention_mask):
+        self.widths.append(input_ids.shape[1])
+        self.batches.append([
+            row[: int(n)] for row, n in zip(input_ids.tolist(), attention_mask.sum(dim=1), strict=True)
+        ])
+        s = (input_ids * attention_mask).sum(dim=1).float()
+        return SimpleNamespace(logits=torch.stack([s % 3, s % 5, s % 7], dim=1))
+
+    @property
+    def n_texts(self) -> int:
+        return sum(len(b) for b in self.batches)
+
+
+def _make_scorer(**settings) -> tuple[SentimentScorer, _FakeModel]:
+    loader = FinBERTLoader(Settings(FINBERT_DEVICE="cpu", **settings))
+    loader.tokenizer = _FakeTokenizer()
+    loader.model = _FakeModel()
+    return SentimentScorer(loader), loader.model
+
+
+def test_result_cache_hits_skip_inference():
+    """Cached and repeated texts should be inferred once and return the same results."""
+    scorer, model = _make_scorer()
+    first = scorer._score_batch_sync(["stock rose", "earnings miss", "stock rose"])
+    assert model.n_texts == 2
+    assert first[0] == first[2]
+
+    second = scorer._score_batch_sync(["earnings miss", "guidance cut", "stock rose"])
+    assert model.n_texts == 3  # only "guidance cut" was new
+    assert second[0] is first[1]
+    assert second[2] is first[0]
+
+
+def test_result_cache_evicts_least_recently_used():
+    """Beyond FINBERT_RESULT_CACHE_SIZE, the least recently used text is dropped."""
+    scorer, model = _make_scorer(FINBERT_RESULT_CACHE_SIZE=2)
+    scorer._score_batch_sync(["one"])
+    scorer._score_batch_sync(["two"])
+    scorer._score_batch_sync(["one"])  # hit: "one" becomes most recent
+    scorer._score_batch_sync(["three"])
+    assert list(scorer.loader.result_cache) == ["one", "three"]
+
+    scorer._score_batch_sync(["two"])
+    assert model.n_texts == 4  # "two" was evicted and inferred again
+
+
+def test_unload_clears_result_cache():
+    """Unloading (and reloading) must not serve results from the previous model."""
+    scorer, _ = _make_scorer()
+    scorer._score_batch_sync(["stock rose"])
+    assert scorer.loader.result_cache
+    scorer.loader.unload()
+    assert not scorer.loader.result_cache
+
+
+def test_length_buckets_keep_input_order():
+    """Batches group texts of similar length, yet results come back in input order."""
+    texts = [
+        "a b c d e f g", "stock", "earnings beat by a wide margin", "miss",
+        "guidance cut", "shares rise on volume", "stock", "beat",
+    ]
+    scorer, model = _make_scorer(FINBERT_BATCH_SIZE=2)
+    results = scorer._score_batch_sync(texts)
+
+    expected = [_make_scorer()[0]._score_batch_sync([t])[0] for t in texts]
+    assert results == expected
+    # 7 unique texts, shortest first: each batch pads only to its own longest member
+    lengths = [[len(ids) for ids in batch] for batch in model.batches]
+    assert [len(b) for b in lengths] == [2, 2, 2, 1]
+    flat = [n for b in lengths for n in b]
+    assert flat == sorted(flat)
+    assert model.widths == [max(b) for b in lengths]
+
+
+async def test_microbatcher_merges_concurrent_calls():
+    """Concurrent callers share one forward pass and each gets its own texts back, in order."""
+    scorer, model = _make_scorer(FINBERT_MICROBATCH_WINDOW_MS=50.0)
+    a, b = await asyncio.gather(
+        scorer.score_texts_async(["stock rose sharply", "miss"]),
+        scorer.score_texts_async(["guidance cut", "stock rose sharply", "beat"]),
+    )
+    assert len(model.batches) == 1
+
+    reference, _ = _make_scorer()
+    assert a == reference._score_batch_sync(["stock rose sharply", "miss"])
+    assert b == reference._score_batch_sync(["guidance cut", "stock rose sharply", "beat"])
+
+
+async def test_microbatcher_cancelled_caller():
+    """Cancelling one caller must not affect the others sharing its batch."""
+    scorer, _ = _make_scorer(FINBERT_MICROBATCH_WINDOW_MS=50.0)
+    cancelled = asyncio.create_task(scorer.score_texts_async(["stock rose"]))
+    kept = asyncio.create_task(scorer.score_texts_async(["earnings miss"]))
+    await asyncio.sleep(0)  # both requests are queued
+    cancelled.cancel()
+
+    assert [r.text for r in await kept] == ["earnings miss"]
+    assert cancelled.cancelled()
+    assert [r.text for r in await scorer.score_texts_async(["beat"])] == ["beat"]
+
+
+async def test_microbatcher_executor_error_fails_every_caller():
+    """An inference exception is raised in every caller of the batch; later calls still work."""
+    scorer, _ = _make_scorer(FINBERT_MICROBATCH_WINDOW_MS=50.0)
+
+    def boom(texts):
+        raise RuntimeError("forward failed")
+
+    scorer._score_batch_sync = boom
+    results = await asyncio.gather(
+        scorer.score_texts_async(["stock rose"]),
+        scorer.score_texts_async(["earnings miss"]),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    del scorer._score_batch_sync
+    assert [r.text for r in await scorer.score_texts_async(["beat"])] == ["beat"]
+
+
+async def test_microbatcher_cancelled_mid_batch_releases_callers():
+    """If the batcher task is cancelled during inference, in-flight and queued callers are released."""
+    scorer, _ = _make_scorer(FINBERT_MICROBATCH_WINDOW_MS=0.0)
+    started, release = threading.Event(), threading.Event()
+
+    def blocking(texts):
+        started.set()
+        release.wait(5)
+        return []
+
+    scorer._score_batch_sync = blocking
+    try:
+        in_flight = asyncio.create_task(scorer.score_texts_async(["stock rose"]))
+        await asyncio.to_thread(started.wait, 5)
+        queued = asyncio.create_task(scorer.score_texts_async(["earnings miss"]))
+        await asyncio.sleep(0)
+
+        _batchers[id(scorer.loader)]._task.cancel()
+        for task in (in_flight, queued):
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(task, 1)
+    finally:
+        release.set()
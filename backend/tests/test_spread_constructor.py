@@ -0,0 +1,84 @@
+"""Unit tests for spread construction."""
+
+from datetime import date, timedelta
+
+from backend.models.options import OptionQuote, OptionType, SpreadType
+from backend.scanner.spread_constructor import MAX_SPREAD_WIDTH_STRIKES, SpreadConstructor
+
+constructor = SpreadConstructor()
+EXPIRY = date.today() + timedelta(days=45)
+
+
+def _make_chain(option_type: OptionType, spot: float = 100.0) -> list[OptionQuote]:
+    quotes = []
+    for strike in range(80, 125, 5):
+        intrinsic = max(0.0, spot - strike) if option_type == OptionType.CALL else max(0.0, strike - spot)
+        bid = round(intrinsic + 2.0, 2)
+        ask = round(bid * 1.05, 2)
+        quotes.append(OptionQuote(
+            symbol=f"TEST{strike}{option_type.value}", underlying="TEST", expiration=EXPIRY,
+            strike=float(strike), option_type=option_type, bid=bid, ask=ask, mid=(bid + ask) / 2,
+            last=bid, volume=500, open_interest=1000, implied_volatility=0.3,
+            delta=0.5, gamma=0.0, theta=0.0, vega=0.0, rho=0.0,
+        ))
+    return quotes
+
+
+def test_bull_call_spread_invariants():
+    """Bull calls: short strike above long, within width limit, debit < width."""
+    spreads = constructor.build_all_spreads(
+        calls=_make_chain(OptionType.CALL), puts=[], strategies=[SpreadType.BULL_CALL], spot_price=100.0,
+    )
+    assert spreads
+    for s in spreads:
+        assert s.short_leg.strike > s.long_leg.strike
+        assert s.spread_width <= 5 * MAX_SPREAD_WIDTH_STRIKES
+        assert 0 < s.net_debit < s.spread_width
+        assert s.max_profit == round(s.spread_width - s.net_debit, 4)
+        assert s.breakeven == round(s.long_leg.strike + s.net_debit, 4)
+        assert 0.01 <= s.probability_of_profit <= 0.99
+
+
+def test_bear_put_spread_invariants():
+    """Bear puts: short strike below long, breakeven below long strike."""
+    spreads = constructor.build_all_spreads(
+        calls=[], puts=_make_chain(OptionType.PUT), strategies=[SpreadType.BEAR_PUT], spot_price=100.0,
+    )
+    assert spreads
+    for s in spreads:
+        assert s.short_leg.strike < s.long_leg.strike
+        assert 0 < s.net_debit < s.spread_width
+        assert s.breakeven == round(s.long_leg.strike - s.net_debit, 4)
+        assert 0.01 <= s.probability_of_profit <= 0.99
+
+
+def test_spread_kernel_loop_matches_numpy():
+    """Loop kernel (numba path) and NumPy fallback enumerate the same pairs."""
+    import numpy as np
+
+    from backend.scanner._spread_kernel import (
+        _enumerate_debit_pairs_loop,
+        _enumerate_debit_pairs_numpy,
+    )
+
+    for option_type, bearish in ((OptionType.CALL, False), (OptionType.PUT, True)):
+        legs = sorted(_make_chain(option_type), key=lambda o: o.strike, reverse=bearish)
+        cols = [np.array([getattr(o, f) for o in legs], dtype=np.float64)
+                for f in ("strike", "bid", "ask", "implied_volatility")]
+        loop = _enumerate_debit_pairs_loop(*cols, 100.0, 45, MAX_SPREAD_WIDTH_STRIKES, bearish)
+        vec = _enumerate_debit_pairs_numpy(*cols, 100.0, 45, MAX_SPREAD_WIDTH_STRIKES, bearish)
+        for a, b in zip(loop, vec, strict=True):
+            np.testing.assert_allclose(a, b, atol=1e-4)
+
+
+def test_leg_quality_vec_matches_scalar():
+    """Vectorized pair bid-ask quality equals the scalar _bid_ask_quality."""
+    import numpy as np
+
+    legs = _make_chain(OptionType.CALL)
+    legs[0] = legs[0].model_copy(update={"bid": 0.0, "ask": 0.0})  # no market → 0
+    arrays = constructor._leg_arrays(legs)
+    q = arrays["ba_quality"]
+    for i in range(len(legs) - 1):
+        vec = float(np.round((q[i] + q[i + 1]) / 2, 4))
+        assert vec == constructor._bid_ask_quality(legs[i], legs[i + 1])